@@ -19,7 +19,6 @@ __all__ = ['handle_prep',
            'main']
 
 import argparse
-import importlib
 import cohere_core.utilities as ut
 import auto_data as ad
 from multiprocessing import Process
@@ -64,9 +63,9 @@ def handle_prep(experiment_dir, **kwargs):
     if 'beamline' in main_conf_map:
         beamline = main_conf_map['beamline']
         try:
-            instr_module = importlib.import_module(f'beamlines.{beamline}.instrument')
-            ph = importlib.import_module(f'beamlines.{beamline}.preprocessor')
-            ver = importlib.import_module(f'beamlines.{beamline}.beam_verifier')
+            instr_module = com.get_beam_module(beamline, 'instrument')
+            ph = com.get_beam_module(beamline, 'preprocessor')
+            ver = com.get_beam_module(beamline, 'beam_verifier')
         except Exception as e:
             print(e)
             print(f'cannot import beamlines.{beamline} module.')
@@ -129,7 +128,7 @@ def handle_prep(experiment_dir, **kwargs):
             scans_datainfo = [[s_d for s_d in batch if s_d[0] not in outliers_scans] for batch in scans_datainfo]
         # save configuration with the auto found outliers. Save even if no outliers found to show it.
         prep_conf_map['outliers_scans'] = outliers_scans
-        ut.write_config(prep_conf_map, ut.join(experiment_dir, 'conf', 'config_prep'))
+        com.write_config(prep_conf_map, ut.join(experiment_dir, 'conf', 'config_prep'))
 
     if separate_scans:
         # get all (scan, data info) tuples, process each scan and save the data in scans directories.
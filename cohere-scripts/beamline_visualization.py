@@ -21,7 +21,6 @@ import os
 import numpy as np
 from functools import partial
 from multiprocessing import Pool, cpu_count
-import importlib
 import cohere_core.utilities as ut
 from tvtk.api import tvtk
 import multipeak as mp
@@ -312,7 +311,7 @@ def process_dir(instr_conf_map, config_map, res_scans_dirs):
 
     beamline = config_map["beamline"]
     try:
-        instr_module = importlib.import_module(f'beamlines.{beamline}.instrument')
+        instr_module = com.get_beam_module(beamline, 'instrument')
     except Exception as e:
         print(e)
         print(f'cannot import beamlines.{beamline}.instrument module.')
@@ -384,22 +383,23 @@ def handle_visualization(experiment_dir, rec_id=None, **kwargs):
         return 'Beamline must be configured in main configuration file'
 
     try:
-        ver = importlib.import_module(f'beamlines.{beamline}.beam_verifier')
+        ver = com.get_beam_module(beamline, 'beam_verifier')
     except Exception as e:
         print(e)
         print(f'cannot import beamlines.{beamline} module.')
         return f'cannot import beamlines.{beamline} module.'
 
     # verify that config files are correct
-    err_msg = ut.verify('config', main_conf_map)
-    if len(err_msg) > 0:
-        return err_msg
-    err_msg = ver.verify('config_disp', disp_conf_map)
-    if len(err_msg) > 0:
-        return err_msg
-    err_msg = ver.verify('config_instr', instr_conf_map)
-    if len(err_msg) > 0:
-        return err_msg
+    if not kwargs.get('no_verify', False):
+        err_msg = ut.verify('config', main_conf_map)
+        if len(err_msg) > 0:
+            return err_msg
+        err_msg = ver.verify('config_disp', disp_conf_map)
+        if len(err_msg) > 0:
+            return err_msg
+        err_msg = ver.verify('config_instr', instr_conf_map)
+        if len(err_msg) > 0:
+            return err_msg
 
     if 'multipeak' in main_conf_map and main_conf_map['multipeak']:
         mp.process_dir(experiment_dir, make_twin=False)
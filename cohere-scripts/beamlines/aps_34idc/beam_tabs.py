@@ -3,6 +3,7 @@ from PyQt5.QtCore import *
 from PyQt5.QtWidgets import *
 import ast
 import cohere_core.utilities as ut
+import common as com
 
 
 def msg_window(text):
@@ -175,15 +176,15 @@ class PrepTab(QWidget):
         else:
             self.white_file_button.setText('')
         if 'Imult' in conf_map:
-            self.Imult.setText(str(conf_map['Imult']).replace(" ", ""))
+            self.Imult.setText(com.stripped(conf_map['Imult']))
         if 'min_files' in conf_map:
-            self.min_files.setText(str(conf_map['min_files']).replace(" ", ""))
+            self.min_files.setText(com.stripped(conf_map['min_files']))
         if 'exclude_scans' in conf_map:
-            self.exclude_scans.setText(str(conf_map['exclude_scans']).replace(" ", ""))
+            self.exclude_scans.setText(com.stripped(conf_map['exclude_scans']))
         if 'outliers_scans' in conf_map:
-            self.outliers_scans.setText(str(conf_map['outliers_scans']).replace(" ", ""))
+            self.outliers_scans.setText(com.stripped(conf_map['outliers_scans']))
         if 'roi' in conf_map:
-            self.roi.setText(str(conf_map['roi']).replace(" ", ""))
+            self.roi.setText(com.stripped(conf_map['roi']))
             self.roi.setStyleSheet('color: black')
 
 
@@ -230,20 +231,20 @@ class PrepTab(QWidget):
         """
         conf_map = {}
         if len(self.data_dir_button.text().strip()) > 0:
-            conf_map['data_dir'] = str(self.data_dir_button.text()).strip()
+            conf_map['data_dir'] = self.data_dir_button.text().strip()
         if len(self.dark_file_button.text().strip()) > 0:
-            conf_map['darkfield_filename'] = str(self.dark_file_button.text().strip())
+            conf_map['darkfield_filename'] = self.dark_file_button.text().strip()
         if len(self.white_file_button.text().strip()) > 0:
-            conf_map['whitefield_filename'] = str(self.white_file_button.text().strip())
+            conf_map['whitefield_filename'] = self.white_file_button.text().strip()
         if len(self.Imult.text()) > 0:
-            conf_map['Imult'] = ast.literal_eval(str(self.Imult.text()).replace(os.linesep,''))
+            conf_map['Imult'] = ast.literal_eval(self.Imult.text().translate(com.no_newlines))
         if len(self.min_files.text()) > 0:
-            min_files = ast.literal_eval(str(self.min_files.text()))
+            min_files = ast.literal_eval(self.min_files.text())
             conf_map['min_files'] = min_files
         if len(self.exclude_scans.text()) > 0:
-            conf_map['exclude_scans'] = ast.literal_eval(str(self.exclude_scans.text()).replace(os.linesep,''))
+            conf_map['exclude_scans'] = ast.literal_eval(self.exclude_scans.text().translate(com.no_newlines))
         if len(self.roi.text()) > 0:
-            conf_map['roi'] = ast.literal_eval(str(self.roi.text()).replace(os.linesep,''))
+            conf_map['roi'] = ast.literal_eval(self.roi.text().translate(com.no_newlines))
 
         return conf_map
 
@@ -279,21 +280,21 @@ class PrepTab(QWidget):
         #     msg_window('cannot prepare data for 34idc, need data directory')
         #     return
 
-        main_config_map = ut.read_config(ut.join(self.main_win.experiment_dir, 'conf', 'config'))
-        auto_data = 'auto_data' in main_config_map and main_config_map['auto_data']
+        # the main config is saved whenever auto data is toggled, so the window state is current
+        auto_data = self.main_win.auto_data.isChecked()
 
         if auto_data:
             # exclude outliers_scans from saving
-            current_prep_map = ut.read_config(ut.join(self.main_win.experiment_dir, 'conf', 'config_prep'))
+            current_prep_map = com.read_config(ut.join(self.main_win.experiment_conf_dir, 'config_prep'))
             if current_prep_map is not None and 'outliers_scans' in current_prep_map:
                 conf_map['outliers_scans'] = current_prep_map['outliers_scans']
-        ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_prep'))
+        com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_prep'))
 
         self.tabs.run_prep()
 
         # reload the window if auto_data as the outliers_scans could change
         if auto_data:
-            prep_map = ut.read_config(ut.join(self.main_win.experiment_dir, 'conf', 'config_prep'))
+            prep_map = com.read_config(ut.join(self.main_win.experiment_conf_dir, 'config_prep'))
             self.load_tab(prep_map)
 
 
@@ -366,7 +367,7 @@ class PrepTab(QWidget):
             #     if self.main_win.no_verify:
             #         ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_prep'))
             # else:
-            ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_prep'))
+            com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_prep'))
 
 
     def notify(self):
@@ -459,9 +460,9 @@ class DispTab(QWidget):
             self.unwrap.setChecked(False)
 
         if 'crop' in conf_map:
-            self.crop.setText(str(conf_map['crop']).replace(" ", ""))
+            self.crop.setText(com.stripped(conf_map['crop']))
         if 'rampups' in conf_map:
-            self.rampups.setText(str(conf_map['rampups']).replace(" ", ""))
+            self.rampups.setText(com.stripped(conf_map['rampups']))
 
 
     def clear_conf(self):
@@ -504,15 +505,15 @@ class DispTab(QWidget):
         """
         conf_map = {}
         if len(self.result_dir_button.text()) > 0:
-            conf_map['results_dir'] = str(self.result_dir_button.text()).replace(os.sep, '/')
+            conf_map['results_dir'] = self.result_dir_button.text().replace(os.sep, '/')
         if self.make_twin.isChecked():
             conf_map['make_twin'] = True
         if self.unwrap.isChecked():
             conf_map['unwrap'] = True
         if len(self.crop.text()) > 0:
-            conf_map['crop'] = ast.literal_eval(str(self.crop.text()).replace(os.linesep, ''))
+            conf_map['crop'] = ast.literal_eval(self.crop.text().translate(com.no_newlines))
         if len(self.rampups.text()) > 0:
-            conf_map['rampups'] = ast.literal_eval(str(self.rampups.text()).replace(os.linesep, ''))
+            conf_map['rampups'] = ast.literal_eval(self.rampups.text().translate(com.no_newlines))
 
         return conf_map
 
@@ -533,11 +534,11 @@ class DispTab(QWidget):
         if not self.main_win.is_exp_set():
             msg_window('the experiment has changed, pres "set experiment" button')
             return
-        if len(str(self.result_dir_button.text())) == 0:
+        if len(self.result_dir_button.text()) == 0:
             msg_window('the results directory is not set')
             return
 
-        results_dir = str(self.result_dir_button.text()).replace(os.sep, '/')
+        results_dir = self.result_dir_button.text().replace(os.sep, '/')
 
         # found_file = False
         # for p, d, f in os.walk(results_dir):
@@ -556,7 +557,7 @@ class DispTab(QWidget):
         #     if not self.main_win.no_verify:
         #         return
 
-        ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_disp'))
+        com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_disp'))
         self.tabs.run_viz()
 
 
@@ -573,7 +574,7 @@ class DispTab(QWidget):
             #     if self.main_win.no_verify:
             #         ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_disp'))
             # else:
-            ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_disp'))
+            com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_disp'))
 
 
     def update_tab(self, **args):
@@ -700,34 +701,34 @@ class SubInstrTab():
 
         # if parameters are configured, override the readings from spec file
         if 'energy' in conf_map:
-            self.energy.setText(str(conf_map['energy']).replace(" ", ""))
+            self.energy.setText(com.stripped(conf_map['energy']))
             self.energy.setStyleSheet('color: black')
         if 'delta' in conf_map:
-            self.delta.setText(str(conf_map['delta']).replace(" ", ""))
+            self.delta.setText(com.stripped(conf_map['delta']))
             self.delta.setStyleSheet('color: black')
         if 'gamma' in conf_map:
-            self.gamma.setText(str(conf_map['gamma']).replace(" ", ""))
+            self.gamma.setText(com.stripped(conf_map['gamma']))
             self.gamma.setStyleSheet('color: black')
         if 'detdist' in conf_map:
-            self.detdist.setText(str(conf_map['detdist']).replace(" ", ""))
+            self.detdist.setText(com.stripped(conf_map['detdist']))
             self.detdist.setStyleSheet('color: black')
         if 'th' in conf_map:
-            self.th.setText(str(conf_map['th']).replace(" ", ""))
+            self.th.setText(com.stripped(conf_map['th']))
             self.th.setStyleSheet('color: black')
         if 'chi' in conf_map:
-            self.chi.setText(str(conf_map['chi']).replace(" ", ""))
+            self.chi.setText(com.stripped(conf_map['chi']))
             self.chi.setStyleSheet('color: black')
         if 'phi' in conf_map:
-            self.phi.setText(str(conf_map['phi']).replace(" ", ""))
+            self.phi.setText(com.stripped(conf_map['phi']))
             self.phi.setStyleSheet('color: black')
         if 'scanmot' in conf_map:
-            self.scanmot.setText(str(conf_map['scanmot']).replace(" ", ""))
+            self.scanmot.setText(com.stripped(conf_map['scanmot']))
             self.scanmot.setStyleSheet('color: black')
         if 'scanmot_del' in conf_map:
-            self.scanmot_del.setText(str(conf_map['scanmot_del']).replace(" ", ""))
+            self.scanmot_del.setText(com.stripped(conf_map['scanmot_del']))
             self.scanmot_del.setStyleSheet('color: black')
         if 'detector' in conf_map:
-            self.detector.setText(str(conf_map['detector']).replace(" ", ""))
+            self.detector.setText(com.stripped(conf_map['detector']))
             self.detector.setStyleSheet('color: black')
 
 
@@ -757,25 +758,25 @@ class SubInstrTab():
         """
         conf_map = {}
         if len(self.energy.text()) > 0:
-            conf_map['energy'] = ast.literal_eval(str(self.energy.text()))
+            conf_map['energy'] = ast.literal_eval(self.energy.text())
         if len(self.delta.text()) > 0:
-            conf_map['delta'] = ast.literal_eval(str(self.delta.text()))
+            conf_map['delta'] = ast.literal_eval(self.delta.text())
         if len(self.gamma.text()) > 0:
-            conf_map['gamma'] = ast.literal_eval(str(self.gamma.text()))
+            conf_map['gamma'] = ast.literal_eval(self.gamma.text())
         if len(self.detdist.text()) > 0:
-            conf_map['detdist'] = ast.literal_eval(str(self.detdist.text()))
+            conf_map['detdist'] = ast.literal_eval(self.detdist.text())
         if len(self.th.text()) > 0:
-            conf_map['th'] = ast.literal_eval(str(self.th.text()))
+            conf_map['th'] = ast.literal_eval(self.th.text())
         if len(self.chi.text()) > 0:
-            conf_map['chi'] = ast.literal_eval(str(self.chi.text()))
+            conf_map['chi'] = ast.literal_eval(self.chi.text())
         if len(self.phi.text()) > 0:
-            conf_map['phi'] = ast.literal_eval(str(self.phi.text()))
+            conf_map['phi'] = ast.literal_eval(self.phi.text())
         if len(self.scanmot.text()) > 0:
-            conf_map['scanmot'] = str(self.scanmot.text())
+            conf_map['scanmot'] = self.scanmot.text()
         if len(self.scanmot_del.text()) > 0:
-            conf_map['scanmot_del'] = ast.literal_eval(str(self.scanmot_del.text()))
+            conf_map['scanmot_del'] = ast.literal_eval(self.scanmot_del.text())
         if len(self.detector.text()) > 0:
-            conf_map['detector'] = str(self.detector.text())
+            conf_map['detector'] = self.detector.text()
 
         return conf_map
 
@@ -792,7 +793,7 @@ class SubInstrTab():
         """
         if not self.main_window.loaded and not self.main_window.is_exp_set():
             return
-        scan = str(self.main_window.scan_widget.text())
+        scan = self.main_window.get_scan()
         if len(scan) == 0:
             msg_window ('cannot parse spec, scan not defined')
             return
@@ -938,7 +939,7 @@ class InstrTab(QWidget):
         nothing
         """
         if 'diffractometer' in conf_map:
-            diff = str(conf_map['diffractometer']).replace(" ", "")
+            diff = com.stripped(conf_map['diffractometer'])
             self.diffractometer.setText(diff)
         if 'specfile' in conf_map:
             specfile = conf_map['specfile']
@@ -1015,9 +1016,9 @@ class InstrTab(QWidget):
         """
         conf_map = {}
         if len(self.diffractometer.text()) > 0:
-            conf_map['diffractometer'] = str(self.diffractometer.text())
+            conf_map['diffractometer'] = self.diffractometer.text()
         if len(self.spec_file_button.text()) > 0:
-            conf_map['specfile'] = str(self.spec_file_button.text())
+            conf_map['specfile'] = self.spec_file_button.text()
 
         if self.add_config:
             conf_map.update(self.extended.get_instr_config())
@@ -1051,5 +1052,5 @@ class InstrTab(QWidget):
         #     if not self.main_win.no_verify:
         #         return
 
-        ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_instr'))
+        com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_instr'))
 
@@ -19,17 +19,66 @@ __all__ = ['select_file',
 import sys
 import os
 import argparse
-import shutil
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+import threading
+from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (QApplication, QWidget, QTabWidget, QStackedWidget, QListWidget, QFormLayout,
+                             QHBoxLayout, QVBoxLayout, QSpacerItem, QPushButton, QLineEdit, QComboBox, QCheckBox,
+                             QFileDialog, QDialog, QInputDialog, QMessageBox)
 import importlib
-import convertconfig as conv
 import ast
 import cohere_core.utilities as ut
 import common as com
 
 
+# converter version does not change while the GUI runs, it is read once by get_converter_version
+converter_version = None
+
+
+def get_converter_version():
+    """
+    Returns version of configuration converter, importing the converter on the first request.
+    Returns
+    -------
+    int
+        converter version
+    """
+    global converter_version
+    if converter_version is None:
+        import convertconfig as conv
+        converter_version = conv.get_version()
+    return converter_version
+
+
+# file dialogs are created once and reused, keyed by file mode
+file_dialogs = {}
+
+
+def get_file_dialog(file_mode, start_dir):
+    """
+    Returns file dialog in given mode, creating it on the first request.
+    Parameters
+    ----------
+    file_mode : QFileDialog.FileMode
+        mode of the dialog
+    start_dir : str
+        directory where to start selecting
+    Returns
+    -------
+    QFileDialog
+        dialog set to start in the given directory
+    """
+    dialog = file_dialogs.get(file_mode)
+    if dialog is None:
+        dialog = QFileDialog(None, 'select dir', start_dir)
+        dialog.setFileMode(file_mode)
+        file_dialogs[file_mode] = dialog
+    else:
+        dialog.setDirectory(start_dir)
+    dialog.setSidebarUrls([QUrl.fromLocalFile(start_dir)])
+    return dialog
+
+
 def select_file(start_dir):
     """
     Shows dialog interface allowing user to select file from file system.
@@ -43,9 +92,7 @@ def select_file(start_dir):
         name of selected file or None
     """
     start_dir = start_dir.replace(os.sep, '/')
-    dialog = QFileDialog(None, 'select dir', start_dir)
-    dialog.setFileMode(QFileDialog.ExistingFile)
-    dialog.setSidebarUrls([QUrl.fromLocalFile(start_dir)])
+    dialog = get_file_dialog(QFileDialog.ExistingFile, start_dir)
     if dialog.exec_() == QDialog.Accepted:
         return str(dialog.selectedFiles()[0]).replace(os.sep, '/')
     else:
@@ -65,9 +112,7 @@ def select_dir(start_dir):
         name of selected directory or None
     """
     start_dir = start_dir.replace(os.sep, '/')
-    dialog = QFileDialog(None, 'select dir', start_dir)
-    dialog.setFileMode(QFileDialog.DirectoryOnly)
-    dialog.setSidebarUrls([QUrl.fromLocalFile(start_dir)])
+    dialog = get_file_dialog(QFileDialog.DirectoryOnly, start_dir)
     if dialog.exec_() == QDialog.Accepted:
         return str(dialog.selectedFiles()[0]).replace(os.sep, '/')
     else:
@@ -92,6 +137,116 @@ def msg_window(text):
     msg.exec_()
 
 
+# processing choices in reconstruction tab, cupy is not supported on macOS
+processors = ('auto',) + (('cp',) if sys.platform != 'darwin' else ()) + ('np', 'torch')
+
+
+def verify_conf(conf_name, conf_map, no_verify):
+    """
+    Verifies configuration parameters and shows error message if the verification fails.
+    Parameters
+    ----------
+    conf_name : str
+        configuration name, alternate 'config_rec_<id>' is verified as 'config_rec'
+    conf_map : dict
+        configuration parameters
+    no_verify : boolean
+        if True, failed verification does not prevent saving the configuration
+    Returns
+    -------
+    boolean
+        True if the configuration can be saved, False otherwise
+    """
+    if conf_name.startswith('config_rec_'):
+        conf_name = 'config_rec'
+    er_msg = ut.verify(conf_name, conf_map)
+    if len(er_msg) > 0:
+        msg_window(er_msg)
+        return no_verify
+    return True
+
+
+def set_if(widget, conf_map, key, clear=False, strip_spaces=True):
+    """
+    Displays parameter value from configuration in the widget.
+    Parameters
+    ----------
+    widget : QLineEdit
+        widget displaying the parameter
+    conf_map : dict
+        configuration parameters
+    key : str
+        parameter name
+    clear : boolean
+        if True the widget text is cleared when the parameter is not configured, otherwise it is left unchanged
+    strip_spaces : boolean
+        if True the spaces are removed from displayed value
+    Returns
+    -------
+    nothing
+    """
+    value = conf_map.get(key)
+    if value is None:
+        if clear:
+            widget.setText('')
+        return
+    widget.setText(com.stripped(value) if strip_spaces else str(value))
+
+
+def preload_module(module_name):
+    """
+    Imports processing module ahead of its first use in a background thread. The processing modules load heavy
+    libraries, importing them while user works in the window avoids a delay when user runs the processing,
+    without blocking the window.
+    Parameters
+    ----------
+    module_name : str
+        name of the module
+    Returns
+    -------
+    nothing
+    """
+    def import_module():
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # the import is repeated when the module is used and the error is reported then
+            pass
+
+    threading.Thread(target=import_module, daemon=True).start()
+
+
+def processed_file_exists(experiment_dir, sub_dir, file_names):
+    """
+    Checks whether any of the files produced by a processing step exists. The files are looked up in the sub_dir
+    directory of the experiment, and of the experiment scan and multipeak directories, as the processing scripts
+    save them there.
+    Parameters
+    ----------
+    experiment_dir : str
+        experiment directory
+    sub_dir : str
+        directory the file is saved in, i.e. 'preprocessed_data', 'phasing_data'
+    file_names : tuple
+        names of the files
+    Returns
+    -------
+    boolean
+        True if any of the files exists, False otherwise
+    """
+    def found(dir):
+        return any(os.path.isfile(ut.join(dir, sub_dir, file_name)) for file_name in file_names)
+
+    if found(experiment_dir):
+        return True
+    with os.scandir(experiment_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(('scan', 'mp')) and entry.is_dir(follow_symlinks=False) \
+                    and found(ut.join(experiment_dir, entry.name)):
+                return True
+    return False
+
+
 class cdi_gui(QWidget):
     def __init__(self, parent=None):
         """
@@ -110,8 +265,12 @@ class cdi_gui(QWidget):
         self.id = None
         self.exp_id = None
         self.experiment_dir = None
+        self.experiment_conf_dir = None
+        self.experiment_conf_file = None
         self.working_dir = None
         self.beamline = None
+        # cached result of checking experiment directory existence, None if it must be checked
+        self.exp_exists = None
 
         uplayout = QHBoxLayout()
         luplayout = QFormLayout()
@@ -174,6 +333,8 @@ class cdi_gui(QWidget):
         self.auto_data.stateChanged.connect(self.toggle_auto_data)
         self.separate_scans.stateChanged.connect(self.toggle_separate_scans)
         self.separate_scan_ranges.stateChanged.connect(self.toggle_separate_scan_ranges)
+        self.Id_widget.textChanged.connect(lambda: self.invalidate_exp_exists())
+        self.scan_widget.textChanged.connect(lambda: self.invalidate_exp_exists())
 
 
     def set_args(self, args, **kwargs):
@@ -202,6 +363,8 @@ class cdi_gui(QWidget):
     def reset_window(self):
         self.exp_id = None
         self.experiment_dir = None
+        self.experiment_conf_dir = None
+        self.experiment_conf_file = None
         self.working_dir = None
         self.set_work_dir_button.setText('')
         self.Id_widget.setText('')
@@ -227,6 +390,7 @@ class cdi_gui(QWidget):
         nothing
         """
         self.working_dir = select_dir(os.getcwd())
+        self.invalidate_exp_exists()
         if self.working_dir is not None:
             self.set_work_dir_button.setStyleSheet("Text-align:left")
             self.set_work_dir_button.setText(self.working_dir)
@@ -252,13 +416,36 @@ class cdi_gui(QWidget):
             return False
         if self.working_dir is None:
             return False
-        exp_id = str(self.Id_widget.text()).strip()
-        scan = str(self.scan_widget.text()).replace(' ','')
-        if scan != '':
-            exp_id = f'{exp_id}_{scan}'
-        if not os.path.exists(ut.join(self.working_dir, exp_id)):
-            return False
-        return True
+        if self.exp_exists is None:
+            exp_id = self.Id_widget.text().strip()
+            scan = self.get_scan()
+            if scan != '':
+                exp_id = f'{exp_id}_{scan}'
+            self.exp_exists = os.path.exists(ut.join(self.working_dir, exp_id))
+        return self.exp_exists
+
+
+    def invalidate_exp_exists(self):
+        """
+        Invoked when the working directory, id, or scan changes. The experiment directory existence will be checked
+        again on the next request.
+        """
+        self.exp_exists = None
+
+
+    def get_scan(self):
+        """
+        Returns scan(s) entered in window with all whitespace removed, the same value is part of experiment id and
+        is saved in main configuration.
+        Parameters
+        ----------
+        none
+        Returns
+        -------
+        str
+            scan(s), empty string if not entered
+        """
+        return self.scan_widget.text().translate(com.no_whitespace)
 
 
     def is_exp_set(self):
@@ -276,7 +463,7 @@ class cdi_gui(QWidget):
             return False
         if self.working_dir is None:
             return False
-        if self.id != str(self.Id_widget.text()).strip():
+        if self.id != self.Id_widget.text().strip():
             return False
         return True
 
@@ -303,6 +490,8 @@ class cdi_gui(QWidget):
 
         conf_list = ['config_prep', 'config_data', 'config_rec', 'config_disp', 'config_instr', 'config_mp']
         conf_dicts, converted = com.get_config_maps(load_dir, conf_list)
+        if converted and self.t is not None and self.t.rec_tab in self.t.initialized:
+            self.t.rec_tab.clear_rec_conf_cache()
 
         self.load_main(conf_dicts['config'])
 
@@ -342,7 +531,7 @@ class cdi_gui(QWidget):
         if 'experiment_id' in conf_map:
             self.Id_widget.setText(conf_map['experiment_id'])
         if 'scan' in conf_map:
-            self.scan_widget.setText(conf_map['scan'].replace(' ',''))
+            self.scan_widget.setText(conf_map['scan'].translate(com.no_spaces))
         if 'beamline' in conf_map:
             self.beamline_widget.setText(conf_map['beamline'])
         if 'auto_data' in conf_map and conf_map['auto_data']:
@@ -365,39 +554,28 @@ class cdi_gui(QWidget):
         -------
         nothing
         """
-        if not os.path.exists(self.experiment_dir):
-            os.makedirs(self.experiment_dir)
-        experiment_conf_dir = ut.join(self.experiment_dir, 'conf')
-        if not os.path.exists(experiment_conf_dir):
-            os.makedirs(experiment_conf_dir)
+        # creating conf directory creates the experiment directory as well
+        os.makedirs(self.experiment_conf_dir, exist_ok=True)
 
 
     def save_main(self):
         # read the configurations from GUI and write to experiment config files
         # save the main config
-        conf_map = {}
-        conf_map['working_dir'] = str(self.working_dir)
-        conf_map['experiment_id'] = self.id
-        if len(self.scan_widget.text()) > 0:
-            conf_map['scan'] = str(self.scan_widget.text())
-        if self.beamline is not None:
-            conf_map['beamline'] = self.beamline
-        if self.multipeak.isChecked():
-            conf_map['multipeak'] = True
-        if self.auto_data.isChecked():
-            conf_map['auto_data'] = True
-        if self.separate_scans.isChecked():
-            conf_map['separate_scans'] = True
-        if self.separate_scan_ranges.isChecked():
-            conf_map['separate_scan_ranges'] = True
-        conf_map['converter_ver'] = conv.get_version()
-        er_msg = ut.verify('config', conf_map)
-        if len(er_msg) > 0:
-            msg_window(er_msg)
-            if self.no_verify:
-                ut.write_config(conf_map, ut.join(self.experiment_dir, 'conf', 'config'))
-        else:
-            ut.write_config(conf_map, ut.join(self.experiment_dir, 'conf', 'config'))
+        scan = self.get_scan()
+        conf_map = {key: value for key, value in (('working_dir', self.working_dir),
+                                                  ('experiment_id', self.id),
+                                                  ('scan', scan if len(scan) > 0 else None),
+                                                  ('beamline', self.beamline))
+                    if value is not None}
+        for key, check_box in (('multipeak', self.multipeak),
+                               ('auto_data', self.auto_data),
+                               ('separate_scans', self.separate_scans),
+                               ('separate_scan_ranges', self.separate_scan_ranges)):
+            if check_box.isChecked():
+                conf_map[key] = True
+        conf_map['converter_ver'] = get_converter_version()
+        if verify_conf('config', conf_map, self.no_verify):
+            com.write_config(conf_map, self.experiment_conf_file)
 
 
     def set_experiment(self, loaded=False):
@@ -428,22 +606,27 @@ class cdi_gui(QWidget):
             self.set_work_dir_button.setText('')
             return
 
-        id = str(self.Id_widget.text()).strip()
+        id = self.Id_widget.text().strip()
         if id == '':
             msg_window('id must be entered')
             return
 
         self.working_dir = working_dir
         self.id = id
-        if len(self.scan_widget.text()) > 0:
-            self.exp_id = f'{self.id}_{str(self.scan_widget.text()).replace(" ","")}'
+        scan = self.get_scan()
+        if len(scan) > 0:
+            self.exp_id = f'{self.id}_{scan}'
         else:
             self.exp_id = self.id
         self.experiment_dir = ut.join(self.working_dir, self.exp_id)
+        self.experiment_conf_dir = ut.join(self.experiment_dir, 'conf')
+        self.experiment_conf_file = ut.join(self.experiment_conf_dir, 'config')
         self.assure_experiment_dir()
+        self.invalidate_exp_exists()
 
-        if len(self.beamline_widget.text().strip()) > 0:
-            self.beamline = str(self.beamline_widget.text()).strip()
+        beamline = self.beamline_widget.text().strip()
+        if len(beamline) > 0:
+            self.beamline = beamline
             if not self.t is None:
                 self.t.update_beamline(self.beamline)
         else:
@@ -451,7 +634,7 @@ class cdi_gui(QWidget):
 
         if self.t is None:
             try:
-                self.t = Tabs(self, self.beamline_widget.text())
+                self.t = Tabs(self, beamline)
                 self.vbox.addWidget(self.t)
             except Exception as e:
                 print(e.text())
@@ -499,40 +682,69 @@ class Tabs(QTabWidget):
         """
         super(Tabs, self).__init__(parent)
         self.main_win = main_win
-
+        # The tabs are added right away, but the content of a tab is created when the tab is shown
+        # for the first time, or when the tab is needed to run. Configuration delivered to a tab
+        # that is not initialized yet is kept in pending_confs and loaded when the tab is initialized.
+        self.initialized = []
+        self.pending_confs = {}
+        self.notify_args = {}
+
+        self.instr_tab = None
+        self.prep_tab = None
+        self.display_tab = None
+        # multi peak tab with created content that was removed when multipeak was unchecked, reused when checked again
+        self.removed_mp_tab = None
+        self.format_tab = DataTab()
+        self.rec_tab = RecTab()
+        self.tabs = [self.format_tab, self.rec_tab]
+        for tab in self.tabs:
+            self.addTab(tab, tab.name)
         if beamline is not None and len(beamline) > 0:
-            try:
-                self.beam = importlib.import_module(f'beamlines.{beamline}.beam_tabs')
-            except Exception as e:
-                print (e)
-                msg_window(f'cannot import beamlines.{beamline} module')
-                raise
-            self.instr_tab = self.beam.InstrTab()
-            self.prep_tab = self.beam.PrepTab()
-            self.format_tab = DataTab()
-            self.rec_tab = RecTab()
-            self.display_tab = self.beam.DispTab()
-            self.tabs = [self.instr_tab, self.prep_tab, self.format_tab, self.rec_tab, self.display_tab]
-        else:
-            self.format_tab = DataTab()
-            self.rec_tab = RecTab()
-            self.tabs = [self.format_tab, self.rec_tab]
-            self.instr_tab = None
-            self.prep_tab = None
-            self.display_tab = None
+            self.add_beam_tabs(beamline)
         if self.main_win.multipeak.isChecked():
             self.mp_tab = MpTab()
+            self.addTab(self.mp_tab, self.mp_tab.name)
             self.tabs = self.tabs + [self.mp_tab]
 
-        for tab in self.tabs:
-            self.addTab(tab, tab.name)
-            tab.init(self, main_win)
+        self.setCurrentIndex(0)
+        self.init_tab(self.currentWidget())
+        self.currentChanged.connect(lambda i: self.init_tab(self.widget(i)))
 
 
-    def update_beamline(self, beamline):
-        # a case when beamline tab is already set
-        if not self.instr_tab is None:
+    def init_tab(self, tab):
+        """
+        Creates the content of the given tab if it was not created yet, and loads configuration delivered to the tab
+        before it was initialized.
+        Parameters
+        ----------
+        tab : QWidget
+            one of the tabs
+        Returns
+        -------
+        nothing
+        """
+        if tab is None or tab in self.initialized:
             return
+        self.initialized.append(tab)
+        tab.init(self, self.main_win)
+        if tab.conf_name in self.pending_confs:
+            tab.load_tab(self.pending_confs.pop(tab.conf_name))
+        if tab in (self.display_tab, self.prep_tab):
+            self.notify(**self.notify_args)
+
+
+    def add_beam_tabs(self, beamline):
+        """
+        Imports the beamline specific tabs module and adds the beamline tabs: instrument and prep in front of the
+        data tab, and display after the reconstruction tab.
+        Parameters
+        ----------
+        beamline : str
+            beamline name, the name of package in beamlines
+        Returns
+        -------
+        nothing
+        """
         try:
             self.beam = importlib.import_module(f'beamlines.{beamline}.beam_tabs')
         except Exception as e:
@@ -541,30 +753,42 @@ class Tabs(QTabWidget):
             raise
         self.instr_tab = self.beam.InstrTab()
         self.insertTab(0, self.instr_tab, self.instr_tab.name)
-        self.instr_tab.init(self, self.main_win)
         self.prep_tab = self.beam.PrepTab()
         self.insertTab(1, self.prep_tab, self.prep_tab.name)
-        self.prep_tab.init(self, self.main_win)
         self.display_tab = self.beam.DispTab()
         self.insertTab(4, self.display_tab, self.display_tab.name)
-        self.display_tab.init(self, self.main_win)
-        self.tabs = self.tabs + [self.instr_tab, self.prep_tab, self.display_tab]
+        # keep the tabs in processing order, as run_all runs them in this order
+        self.tabs = [self.instr_tab, self.prep_tab] + self.tabs
+        self.tabs.insert(4, self.display_tab)
+
+
+    def update_beamline(self, beamline):
+        # a case when beamline tab is already set
+        if not self.instr_tab is None:
+            return
+        self.add_beam_tabs(beamline)
 
     def notify(self, **args):
+        # keep the arguments, so the tabs initialized later can be updated
+        self.notify_args = args
         try:
-            self.display_tab.update_tab(**args)
-            self.prep_tab.update_tab(**args)
+            if self.display_tab in self.initialized:
+                self.display_tab.update_tab(**args)
+            if self.prep_tab in self.initialized:
+                self.prep_tab.update_tab(**args)
         except:
             pass
 
 
     def clear_configs(self):
-        for tab in self.tabs:
+        self.pending_confs = {}
+        for tab in self.initialized:
             tab.clear_conf()
 
 
     def run_all(self):
         for tab in self.tabs:
+            self.init_tab(tab)
             tab.run_tab()
 
     def run_prep(self):
@@ -587,28 +811,49 @@ class Tabs(QTabWidget):
     def load_conf(self, conf_dirs):
         for tab in self.tabs:
             if tab.conf_name in conf_dirs.keys():
-                tab.load_tab(conf_dirs[tab.conf_name])
+                if tab in self.initialized:
+                    tab.load_tab(conf_dirs[tab.conf_name])
+                else:
+                    self.pending_confs[tab.conf_name] = conf_dirs[tab.conf_name]
 
 
     def save_conf(self):
-        for tab in self.tabs:
-            tab.save_conf()
+        with com.batched_writes():
+            for tab in self.initialized:
+                tab.save_conf()
+            # tabs that were not initialized have no parameters changed in window, but the experiment directory
+            # may be new, so write the configuration delivered to them as it was loaded
+            for tab in self.tabs:
+                if tab not in self.initialized and tab.conf_name in self.pending_confs:
+                    com.write_config(self.pending_confs[tab.conf_name],
+                                     ut.join(self.main_win.experiment_conf_dir, tab.conf_name))
 
 
     def toggle_checked(self, is_checked, is_multipeak):
         if is_multipeak:
             if is_checked:
-                self.mp_tab = MpTab()
+                if self.removed_mp_tab is not None:
+                    # reuse the tab content instead of creating the widgets again
+                    self.mp_tab = self.removed_mp_tab
+                    self.removed_mp_tab = None
+                    self.mp_tab.clear_conf()
+                    self.initialized.append(self.mp_tab)
+                    if self.mp_tab.conf_name in self.pending_confs:
+                        self.mp_tab.load_tab(self.pending_confs.pop(self.mp_tab.conf_name))
+                else:
+                    self.mp_tab = MpTab()
                 self.addTab(self.mp_tab, self.mp_tab.name)
-                self.mp_tab.init(self, self.main_win)
                 self.tabs = self.tabs + [self.mp_tab]
             else:
                 self.removeTab(self.count()-1)
                 self.tabs.remove(self.mp_tab)
+                if self.mp_tab in self.initialized:
+                    self.initialized.remove(self.mp_tab)
+                    self.removed_mp_tab = self.mp_tab
                 self.mp_tab = None
 
         # change the Instrument tab if present
-        if not self.instr_tab is None:
+        if self.instr_tab in self.initialized:
             self.instr_tab.toggle_config()
 
 
@@ -637,14 +882,12 @@ class DataTab(QWidget):
 
         layout = QFormLayout()
         self.alien_alg = QComboBox()
-        self.alien_alg.addItem("none")
-        self.alien_alg.addItem("block aliens")
-        self.alien_alg.addItem("alien file")
-        self.alien_alg.addItem("AutoAlien1")
+        self.alien_alg.addItems(["none", "block aliens", "alien file", "AutoAlien1"])
         layout.addRow("alien algorithm", self.alien_alg)
-        sub_layout = QFormLayout()
-        self.set_alien_layout(sub_layout)
-        layout.addRow(sub_layout)
+        self.alien_blocks = self.make_alien_blocks()
+        for block in self.alien_blocks.values():
+            layout.addRow(block)
+        self.set_alien_layout()
         self.intensity_threshold = QLineEdit()
         layout.addRow("Intensity Threshold", self.intensity_threshold)
         self.center_shift = QLineEdit()
@@ -663,15 +906,22 @@ class DataTab(QWidget):
         layout.addRow(cmd_layout)
         self.setLayout(layout)
 
-        self.alien_alg.currentIndexChanged.connect(lambda: self.set_alien_layout(sub_layout))
+        self.alien_alg.currentIndexChanged.connect(lambda: self.set_alien_layout())
         # this will create config_data file and run data script
         # to generate data ready for reconstruction
         self.config_data_button.clicked.connect(self.run_tab)
         self.set_data_conf_from_button.clicked.connect(self.load_data_conf)
 
+        preload_module('standard_preprocess')
+
 
     def clear_conf(self):
         self.alien_alg.setCurrentIndex(0)
+        # the alien parameters widgets persist, clear them too
+        for widget in (self.aliens, self.alien_file, self.AA1_size_threshold, self.AA1_asym_threshold,
+                       self.AA1_min_pts, self.AA1_eps, self.AA1_amp_threshold, self.AA1_expandcleanedsigma):
+            widget.setText('')
+        self.AA1_save_arrs.setChecked(False)
         self.intensity_threshold.setText('')
         self.binning.setText('')
         self.center_shift.setText('')
@@ -689,44 +939,34 @@ class DataTab(QWidget):
         -------
         nothing
         """
-        if 'alien_alg' not in conf_map:
-            conf_map['alien_alg'] = 'random'
-        if conf_map['alien_alg'] == 'random':
+        alien_alg = conf_map.get('alien_alg', 'random')
+        fields = []
+        if alien_alg == 'random':
             self.alien_alg.setCurrentIndex(0)
-        elif conf_map['alien_alg'] == 'block_aliens':
+        elif alien_alg == 'block_aliens':
             self.alien_alg.setCurrentIndex(1)
-            if 'aliens' in conf_map:
-                self.aliens.setText(str(conf_map['aliens']).replace(" ", ""))
-        elif conf_map['alien_alg'] == 'alien_file':
+            fields = [('aliens', self.aliens)]
+        elif alien_alg == 'alien_file':
             self.alien_alg.setCurrentIndex(2)
-            if 'alien_file' in conf_map:
-                self.alien_file.setText(str(conf_map['alien_file']).replace(" ", ""))
-        elif conf_map['alien_alg'] == 'AutoAlien1':
+            fields = [('alien_file', self.alien_file)]
+        elif alien_alg == 'AutoAlien1':
             self.alien_alg.setCurrentIndex(3)
-            if 'AA1_size_threshold' in conf_map:
-                self.AA1_size_threshold.setText(str(conf_map['AA1_size_threshold']).replace(" ", ""))
-            if 'AA1_asym_threshold' in conf_map:
-                self.AA1_asym_threshold.setText(str(conf_map['AA1_asym_threshold']).replace(" ", ""))
-            if 'AA1_min_pts' in conf_map:
-                self.AA1_min_pts.setText(str(conf_map['AA1_min_pts']).replace(" ", ""))
-            if 'AA1_eps' in conf_map:
-                self.AA1_eps.setText(str(conf_map['AA1_eps']).replace(" ", ""))
-            if 'AA1_amp_threshold' in conf_map:
-                self.AA1_amp_threshold.setText(str(conf_map['AA1_amp_threshold']).replace(" ", ""))
-            if 'AA1_save_arrs' in conf_map:
-                self.AA1_save_arrs.setChecked(conf_map['AA1_save_arrs'])
-            else:
-                self.AA1_save_arrs.setChecked(False)
-            if 'AA1_expandcleanedsigma' in conf_map:
-                self.AA1_expandcleanedsigma.setText(str(conf_map['AA1_expandcleanedsigma']).replace(" ", ""))
-        if 'intensity_threshold' in conf_map:
-            self.intensity_threshold.setText(str(conf_map['intensity_threshold']).replace(" ", ""))
-        if 'binning' in conf_map:
-            self.binning.setText(str(conf_map['binning']).replace(" ", ""))
-        if 'center_shift' in conf_map:
-            self.center_shift.setText(str(conf_map['center_shift']).replace(" ", ""))
-        if 'adjust_dimensions' in conf_map:
-            self.adjust_dimensions.setText(str(conf_map['adjust_dimensions']).replace(" ", ""))
+            self.AA1_save_arrs.setChecked(conf_map.get('AA1_save_arrs', False))
+            fields = [('AA1_size_threshold', self.AA1_size_threshold),
+                      ('AA1_asym_threshold', self.AA1_asym_threshold),
+                      ('AA1_min_pts', self.AA1_min_pts),
+                      ('AA1_eps', self.AA1_eps),
+                      ('AA1_amp_threshold', self.AA1_amp_threshold),
+                      ('AA1_expandcleanedsigma', self.AA1_expandcleanedsigma)]
+
+        fields = fields + [('intensity_threshold', self.intensity_threshold),
+                           ('binning', self.binning),
+                           ('center_shift', self.center_shift),
+                           ('adjust_dimensions', self.adjust_dimensions)]
+        for key, widget in fields:
+            value = conf_map.get(key)
+            if value is not None:
+                widget.setText(com.stripped(value))
 
 
     def get_data_config(self):
@@ -742,73 +982,98 @@ class DataTab(QWidget):
         """
         conf_map = {}
 
-        if self.alien_alg.currentIndex() == 1:
+        fields = []
+        idx = self.alien_alg.currentIndex()
+        if idx == 1:
             conf_map['alien_alg'] = 'block_aliens'
-            if len(self.aliens.text()) > 0:
-                conf_map['aliens'] = str(self.aliens.text()).replace(os.linesep, '')
-        if self.alien_alg.currentIndex() == 2:
+            aliens = self.aliens.text()
+            if len(aliens) > 0:
+                conf_map['aliens'] = aliens.translate(com.no_newlines)
+        elif idx == 2:
             conf_map['alien_alg'] = 'alien_file'
-            if len(self.alien_file.text()) > 0:
-                conf_map['alien_file'] = str(self.alien_file.text())
-        elif self.alien_alg.currentIndex() == 3:
+            alien_file = self.alien_file.text()
+            if len(alien_file) > 0:
+                conf_map['alien_file'] = alien_file
+        elif idx == 3:
             conf_map['alien_alg'] = 'AutoAlien1'
-            if len(self.AA1_size_threshold.text()) > 0:
-                conf_map['AA1_size_threshold'] = ast.literal_eval(str(self.AA1_size_threshold.text()))
-            if len(self.AA1_asym_threshold.text()) > 0:
-                conf_map['AA1_asym_threshold'] = ast.literal_eval(str(self.AA1_asym_threshold.text()))
-            if len(self.AA1_min_pts.text()) > 0:
-                conf_map['AA1_min_pts'] = ast.literal_eval(str(self.AA1_min_pts.text()))
-            if len(self.AA1_eps.text()) > 0:
-                conf_map['AA1_eps'] = ast.literal_eval(str(self.AA1_eps.text()))
-            if len(self.AA1_amp_threshold.text()) > 0:
-                conf_map['AA1_amp_threshold'] = ast.literal_eval(str(self.AA1_amp_threshold.text()))
             if self.AA1_save_arrs.isChecked():
                 conf_map['AA1_save_arrs'] = True
-            if len(self.AA1_expandcleanedsigma.text()) > 0:
-                conf_map['AA1_expandcleanedsigma'] = ast.literal_eval(str(self.AA1_expandcleanedsigma.text()))
-
-        if len(self.intensity_threshold.text()) > 0:
-            conf_map['intensity_threshold'] = ast.literal_eval(str(self.intensity_threshold.text()))
-        if len(self.binning.text()) > 0:
-            conf_map['binning'] = ast.literal_eval(str(self.binning.text()).replace(os.linesep, ''))
-        if len(self.center_shift.text()) > 0:
-            conf_map['center_shift'] = ast.literal_eval(str(self.center_shift.text()).replace(os.linesep, ''))
-        if len(self.adjust_dimensions.text()) > 0:
-            conf_map['adjust_dimensions'] = ast.literal_eval(str(self.adjust_dimensions.text()).replace(os.linesep, ''))
+            fields = [('AA1_size_threshold', self.AA1_size_threshold),
+                      ('AA1_asym_threshold', self.AA1_asym_threshold),
+                      ('AA1_min_pts', self.AA1_min_pts),
+                      ('AA1_eps', self.AA1_eps),
+                      ('AA1_amp_threshold', self.AA1_amp_threshold),
+                      ('AA1_expandcleanedsigma', self.AA1_expandcleanedsigma)]
+
+        fields = fields + [('intensity_threshold', self.intensity_threshold),
+                           ('binning', self.binning),
+                           ('center_shift', self.center_shift),
+                           ('adjust_dimensions', self.adjust_dimensions)]
+        for key, widget in fields:
+            text = widget.text()
+            if len(text) > 0:
+                conf_map[key] = ast.literal_eval(text.translate(com.no_newlines))
 
         return conf_map
 
 
-    def set_alien_layout(self, layout):
-        for i in reversed(range(layout.count())):
-            layout.itemAt(i).widget().setParent(None)
-        if self.alien_alg.currentIndex() == 1:
-            self.aliens = QLineEdit()
-            layout.addRow("aliens", self.aliens)
-        elif self.alien_alg.currentIndex() == 2:
-            self.alien_file = QPushButton()
-            layout.addRow("alien file", self.alien_file)
-            self.alien_file.clicked.connect(self.set_alien_file)
-        elif self.alien_alg.currentIndex() == 3:
-            self.AA1_size_threshold = QLineEdit()
-            layout.addRow("relative size threshold", self.AA1_size_threshold)
-            self.AA1_asym_threshold = QLineEdit()
-            layout.addRow("average asymmetry threshold", self.AA1_asym_threshold)
-            self.AA1_min_pts = QLineEdit()
-            layout.addRow("min pts in cluster", self.AA1_min_pts)
-            self.AA1_eps = QLineEdit()
-            layout.addRow("cluster alg eps", self.AA1_eps)
-            self.AA1_amp_threshold = QLineEdit()
-            layout.addRow("alien alg amp threshold", self.AA1_amp_threshold)
-            self.AA1_save_arrs = QCheckBox()
-            layout.addRow("save analysis arrs", self.AA1_save_arrs)
-            self.AA1_save_arrs.setChecked(False)
-            self.AA1_expandcleanedsigma = QLineEdit()
-            layout.addRow("expand cleaned sigma", self.AA1_expandcleanedsigma)
-            self.AA1_default_button = QPushButton('set AutoAlien1 parameters to defaults', self)
-            layout.addWidget(self.AA1_default_button)
-
-            self.AA1_default_button.clicked.connect(self.set_AA1_defaults)
+    def make_alien_blocks(self):
+        """
+        Creates widget blocks with parameters for each of the alien algorithms. The blocks are created once and
+        only the one matching the selected algorithm is visible.
+        Parameters
+        ----------
+        none
+        Returns
+        -------
+        blocks : dict
+            maps alien algorithm combobox index to the block widget
+        """
+        blocks = {}
+
+        block = QWidget()
+        layout = QFormLayout(block)
+        self.aliens = QLineEdit()
+        layout.addRow("aliens", self.aliens)
+        blocks[1] = block
+
+        block = QWidget()
+        layout = QFormLayout(block)
+        self.alien_file = QPushButton()
+        layout.addRow("alien file", self.alien_file)
+        self.alien_file.clicked.connect(self.set_alien_file)
+        blocks[2] = block
+
+        block = QWidget()
+        layout = QFormLayout(block)
+        self.AA1_size_threshold = QLineEdit()
+        layout.addRow("relative size threshold", self.AA1_size_threshold)
+        self.AA1_asym_threshold = QLineEdit()
+        layout.addRow("average asymmetry threshold", self.AA1_asym_threshold)
+        self.AA1_min_pts = QLineEdit()
+        layout.addRow("min pts in cluster", self.AA1_min_pts)
+        self.AA1_eps = QLineEdit()
+        layout.addRow("cluster alg eps", self.AA1_eps)
+        self.AA1_amp_threshold = QLineEdit()
+        layout.addRow("alien alg amp threshold", self.AA1_amp_threshold)
+        self.AA1_save_arrs = QCheckBox()
+        layout.addRow("save analysis arrs", self.AA1_save_arrs)
+        self.AA1_save_arrs.setChecked(False)
+        self.AA1_expandcleanedsigma = QLineEdit()
+        layout.addRow("expand cleaned sigma", self.AA1_expandcleanedsigma)
+        self.AA1_default_button = QPushButton('set AutoAlien1 parameters to defaults', block)
+        layout.addWidget(self.AA1_default_button)
+        self.AA1_default_button.clicked.connect(self.set_AA1_defaults)
+        blocks[3] = block
+
+        return blocks
+
+
+    def set_alien_layout(self):
+        # show only the parameters of the selected alien algorithm
+        idx = self.alien_alg.currentIndex()
+        for block_idx, block in self.alien_blocks.items():
+            block.setVisible(block_idx == idx)
 
 
     def set_AA1_defaults(self):
@@ -851,44 +1116,31 @@ class DataTab(QWidget):
             msg_window('the experiment has not been created yet')
         elif not self.main_win.is_exp_set():
             msg_window('the experiment has changed, pres "set experiment" button')
-        elif len(self.intensity_threshold.text()) == 0 and not self.main_win.auto_data:
+        elif len(self.intensity_threshold.text()) == 0 and not self.main_win.auto_data.isChecked():
             msg_window('Please, enter Intensity Threshold parameter')
         else:
-            found_file = False
-            for p, d, f in os.walk(self.main_win.experiment_dir):
-                if 'prep_data.tif' in f:
-                    found_file = True
-                    break
-            if found_file:
+            if processed_file_exists(self.main_win.experiment_dir, 'preprocessed_data', ('prep_data.tif',)):
                 conf_map = self.get_data_config()
                 # verify that data configuration is ok
-                er_msg = ut.verify('config_data', conf_map)
-                if len(er_msg) > 0:
-                    msg_window(er_msg)
-                    if not self.main_win.no_verify:
-                        return
-                ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_data'))
+                if not verify_conf('config_data', conf_map, self.main_win.no_verify):
+                    return
+                com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_data'))
                 run_dt.format_data(self.main_win.experiment_dir, no_verify=self.main_win.no_verify)
+                # reload the window if auto_data as the intensity_threshold and binning could change
+                if self.main_win.auto_data.isChecked():
+                    data_map = com.read_config(ut.join(self.main_win.experiment_conf_dir, 'config_data'))
+                    self.load_tab(data_map)
             else:
                 msg_window('Please, run data preparation in previous tab to activate this function')
 
-        # reload the window if auto_data as the intensity_threshold and binning could change
-        main_conf_map = ut.read_config(ut.join(self.main_win.experiment_dir, 'conf', 'config'))
-        if 'auto_data' in main_conf_map and main_conf_map['auto_data']:
-            data_map = ut.read_config(ut.join(self.main_win.experiment_dir, 'conf', 'config_data'))
-            self.load_tab(data_map)
-
 
     def save_conf(self):
         # save data config
         conf_map = self.get_data_config()
         if len(conf_map) > 0:
-            er_msg = ut.verify('config_data', conf_map)
-            if len(er_msg) > 0:
-                msg_window(er_msg)
-                if not self.main_win.no_verify:
-                    return
-            ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_data'))
+            if not verify_conf('config_data', conf_map, self.main_win.no_verify):
+                return
+            com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_data'))
 
 
     def load_data_conf(self):
@@ -932,34 +1184,45 @@ class RecTab(QWidget):
         self.tabs = tabs
         self.main_win = main_window
         self.old_conf_id = ''
+        self.rec_ids = []
+        # ((conf directory, its modification time), alternate configurations ids) from last scan
+        self.rec_ids_scan = None
+        # reconstruction configurations last written by this tab, mapped by file name
+        self.rec_conf_cache = {}
 
         layout = QVBoxLayout()
         ulayout = QFormLayout()
         mlayout = QHBoxLayout()
 
         self.init_guess = QComboBox()
-        self.init_guess.InsertAtBottom
-        self.init_guess.addItem("random")
-        self.init_guess.addItem("continue")
-        self.init_guess.addItem("AI algorithm")
+        self.init_guess.addItems(["random", "continue", "AI algorithm"])
         ulayout.addRow("initial guess", self.init_guess)
-        sub_layout = QFormLayout()
-        self.set_init_guess_layout(sub_layout)
-        ulayout.addRow(sub_layout)
+        # pages with parameters of each initial guess choice, in the init_guess combobox order
+        self.init_guess_stack = QStackedWidget()
+        self.init_guess_stack.addWidget(QWidget())
+        page = QWidget()
+        page_layout = QFormLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self.cont_dir_button = QPushButton()
+        page_layout.addRow("continue directory", self.cont_dir_button)
+        self.init_guess_stack.addWidget(page)
+        page = QWidget()
+        page_layout = QFormLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self.AI_trained_model = QPushButton()
+        page_layout.addRow("AI trained model file", self.AI_trained_model)
+        self.init_guess_stack.addWidget(page)
+        ulayout.addRow(self.init_guess_stack)
+        self.set_init_guess_layout()
 
         self.add_conf_button = QPushButton('add configuration', self)
         ulayout.addWidget(self.add_conf_button)
         self.rec_id = QComboBox()
-        self.rec_id.InsertAtBottom
         self.rec_id.addItem("main")
         ulayout.addWidget(self.rec_id)
         self.rec_id.hide()
         self.proc = QComboBox()
-        self.proc.addItem("auto")
-        if sys.platform != 'darwin':
-            self.proc.addItem("cp")
-        self.proc.addItem("np")
-        self.proc.addItem("torch")
+        self.proc.addItems(processors)
         ulayout.addRow("processor type", self.proc)
         self.device = QLineEdit()
         ulayout.addRow("device(s)", self.device)
@@ -974,6 +1237,17 @@ class RecTab(QWidget):
         ulayout.addRow("initial support area", self.initial_support_area)
         self.rec_default_button = QPushButton('set to defaults', self)
         ulayout.addWidget(self.rec_default_button)
+        # (parameter, widget, function parsing widget text, error message) for parameters read by get_rec_config
+        self.rec_fields = [
+            ('reconstructions', self.reconstructions, ast.literal_eval,
+             'reconstructions parameter should be int'),
+            ('device', self.device, lambda text: text if text == 'all' else ast.literal_eval(text),
+             'device parameter should be "all" or a list of int or dict'),
+            ('algorithm_sequence', self.alg_seq, str.strip, None),
+            ('hio_beta', self.hio_beta, ast.literal_eval,
+             'hio_beta parameter should be float'),
+            ('initial_support_area', self.initial_support_area, ast.literal_eval,
+             'initial_support_area parameter should be a list of floats')]
 
         self.features = Features(self, mlayout)
 
@@ -996,12 +1270,16 @@ class RecTab(QWidget):
         self.setLayout(layout)
 
         self.config_rec_button.clicked.connect(self.run_tab)
-        self.init_guess.currentIndexChanged.connect(lambda: self.set_init_guess_layout(sub_layout))
+        self.init_guess.currentIndexChanged.connect(lambda: self.set_init_guess_layout())
+        self.cont_dir_button.clicked.connect(self.set_cont_dir)
+        self.AI_trained_model.clicked.connect(self.set_aitm_file)
         self.rec_default_button.clicked.connect(self.set_defaults)
         self.add_conf_button.clicked.connect(self.add_rec_conf)
         self.rec_id.currentIndexChanged.connect(self.toggle_conf)
         self.set_rec_conf_from_button.clicked.connect(self.load_rec_conf_dir)
 
+        preload_module('run_reconstruction')
+
 
     def load_tab(self, conf_map, update_rec_choice=True):
         if 'init_guess' not in conf_map:
@@ -1011,11 +1289,11 @@ class RecTab(QWidget):
         elif conf_map['init_guess'] == 'continue':
             self.init_guess.setCurrentIndex(1)
             if 'continue_dir' in conf_map:
-                self.cont_dir_button.setText(str(conf_map['continue_dir'].replace(os.sep, '/')).replace(" ", ""))
+                self.cont_dir_button.setText(com.stripped(conf_map['continue_dir'].replace(os.sep, '/')))
         elif conf_map['init_guess'] == 'AI_guess':
             self.init_guess.setCurrentIndex(2)
             if 'AI_trained_model' in conf_map:
-                self.AI_trained_model.setText(str(conf_map['AI_trained_model'].replace(os.sep, '/')).replace(" ", ""))
+                self.AI_trained_model.setText(com.stripped(conf_map['AI_trained_model'].replace(os.sep, '/')))
                 self.AI_trained_model.setStyleSheet("Text-align:left")
 
         # this will update the configuration choices by reading configuration files names
@@ -1026,19 +1304,13 @@ class RecTab(QWidget):
 
         if 'processing' in conf_map:
             self.proc.setCurrentText(str(conf_map['processing']))
-        if 'device' in conf_map:
-            self.device.setText(str(conf_map['device']).replace(" ", ""))
-        if 'reconstructions' in conf_map:
-            self.reconstructions.setText(str(conf_map['reconstructions']).replace(" ", ""))
-        if 'algorithm_sequence' in conf_map:
-            self.alg_seq.setText(str(conf_map['algorithm_sequence']))
-        if 'hio_beta' in conf_map:
-            self.hio_beta.setText(str(conf_map['hio_beta']).replace(" ", ""))
-        if 'initial_support_area' in conf_map:
-            self.initial_support_area.setText(str(conf_map['initial_support_area']).replace(" ", ""))
-
-        for feat_id in self.features.feature_dir:
-            self.features.feature_dir[feat_id].init_config(conf_map)
+        set_if(self.device, conf_map, 'device')
+        set_if(self.reconstructions, conf_map, 'reconstructions')
+        set_if(self.alg_seq, conf_map, 'algorithm_sequence', strip_spaces=False)
+        set_if(self.hio_beta, conf_map, 'hio_beta')
+        set_if(self.initial_support_area, conf_map, 'initial_support_area')
+
+        self.features.load_config(conf_map)
 
         self.notify()
 
@@ -1049,14 +1321,17 @@ class RecTab(QWidget):
         for _ in range(nu_to_remove):
             self.rec_id.removeItem(1)
         self.old_conf_id = ''
+        self.rec_conf_cache = {}
         self.device.setText('')
         self.proc.setCurrentIndex(0)
         self.reconstructions.setText('')
         self.alg_seq.setText('')
         self.hio_beta.setText('')
         self.initial_support_area.setText('')
-        for feat_id in self.features.feature_dir:
-            self.features.feature_dir[feat_id].active.setChecked(False)
+        self.cont_dir_button.setText('')
+        self.AI_trained_model.setText('')
+        for feature in self.features.feature_dir.values():
+            feature.clear()
 
 
     def get_rec_config(self):
@@ -1071,48 +1346,30 @@ class RecTab(QWidget):
             contains parameters read from window
         """
         conf_map = {}
-        if len(self.reconstructions.text()) > 0:
-            try:
-                conf_map['reconstructions'] = ast.literal_eval(self.reconstructions.text())
-            except:
-                msg_window('reconstructions parameter should be int')
-                return {}
-        if len(self.proc.currentText()) > 0:
-            conf_map['processing'] = str(self.proc.currentText())
-        if len(self.device.text()) > 0:
-            try:
-                d = str(self.device.text()).replace(os.linesep,'')
-                if d == 'all':
-                    conf_map['device'] = d
-                else:
-                    conf_map['device'] = ast.literal_eval(d)
-            except:
-                msg_window('device parameter should be "all" or a list of int or dict')
-                return {}
-        if len(self.alg_seq.text()) > 0:
-            conf_map['algorithm_sequence'] = str(self.alg_seq.text()).strip()
-        if len(self.hio_beta.text()) > 0:
-            try:
-                conf_map['hio_beta'] = ast.literal_eval(str(self.hio_beta.text()))
-            except:
-                msg_window('hio_beta parameter should be float')
-                return {}
-        if len(self.initial_support_area.text()) > 0:
-            try:
-                conf_map['initial_support_area'] = ast.literal_eval(str(self.initial_support_area.text()).replace(os.linesep,''))
-            except:
-                msg_window('initial_support_area parameter should be a list of floats')
-                return {}
+        processing = self.proc.currentText()
+        if len(processing) > 0:
+            conf_map['processing'] = processing
+        for key, widget, parse, er_msg in self.rec_fields:
+            text = widget.text().translate(com.no_newlines)
+            if len(text) > 0:
+                try:
+                    conf_map[key] = parse(text)
+                except:
+                    msg_window(er_msg)
+                    return {}
         if self.init_guess.currentIndex() == 1:
             conf_map['init_guess'] = 'continue'
             if len(self.cont_dir_button.text().strip()) > 0:
-                conf_map['continue_dir'] = str(self.cont_dir_button.text()).replace(os.sep, '/').strip()
+                conf_map['continue_dir'] = self.cont_dir_button.text().replace(os.sep, '/').strip()
         elif self.init_guess.currentIndex() == 2:
             conf_map['init_guess'] = 'AI_guess'
             if len(self.AI_trained_model.text()) > 0:
-                conf_map['AI_trained_model'] = str(self.AI_trained_model.text()).replace(os.sep, '/').strip()
-        for feat_id in self.features.feature_dir:
-            self.features.feature_dir[feat_id].add_config(conf_map)
+                conf_map['AI_trained_model'] = self.AI_trained_model.text().replace(os.sep, '/').strip()
+        # keep the features order, not the order they were created
+        for feat_id in self.features.feature_ids:
+            feature = self.features.feature_dir.get(feat_id)
+            if feature is not None:
+                feature.add_config(conf_map)
 
         return conf_map
 
@@ -1122,20 +1379,47 @@ class RecTab(QWidget):
         if len(conf_map) == 0:
             return
 
-        ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', 'config_rec'))
+        self.write_rec_conf(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_rec'))
 
 
-    def set_init_guess_layout(self, layout):
-        for i in reversed(range(layout.count())):
-            layout.itemAt(i).widget().setParent(None)
-        if self.init_guess.currentIndex() == 1:
-            self.cont_dir_button = QPushButton()
-            layout.addRow("continue directory", self.cont_dir_button)
-            self.cont_dir_button.clicked.connect(self.set_cont_dir)
-        elif self.init_guess.currentIndex() == 2:
-            self.AI_trained_model = QPushButton()
-            layout.addRow("AI trained model file", self.AI_trained_model)
-            self.AI_trained_model.clicked.connect(self.set_aitm_file)
+    def write_rec_conf(self, conf_map, conf_file):
+        """
+        Writes reconstruction configuration file and keeps the configuration, so it does not need to be read when
+        toggling back to it. The configuration is kept only when the file was written. If the write is deferred by
+        batched writes, the file may never be written, and it is read when needed.
+        Parameters
+        ----------
+        conf_map : dict
+            reconstruction configuration parameters
+        conf_file : str
+            configuration file name
+        Returns
+        -------
+        nothing
+        """
+        self.rec_conf_cache.pop(conf_file, None)
+        com.write_config(conf_map, conf_file)
+        if com.pending_writes is None:
+            self.rec_conf_cache[conf_file] = conf_map
+
+
+    def clear_rec_conf_cache(self):
+        """
+        Forgets the kept reconstruction configurations. Called when the configuration files may have been changed
+        outside of this tab, i.e. reloaded or converted.
+        Parameters
+        ----------
+        none
+        Returns
+        -------
+        nothing
+        """
+        self.rec_conf_cache = {}
+
+
+    def set_init_guess_layout(self):
+        # show the page with parameters of the selected initial guess
+        self.init_guess_stack.setCurrentIndex(self.init_guess.currentIndex())
 
 
     def set_cont_dir(self):
@@ -1166,6 +1450,8 @@ class RecTab(QWidget):
 
 
     def add_rec_conf(self):
+        import shutil
+
         id, ok = QInputDialog.getText(self, '', "enter configuration id")
         if id in self.rec_ids:
             msg_window(f'the {id} is alredy used')
@@ -1180,9 +1466,8 @@ class RecTab(QWidget):
             return
 
         # copy the config_rec into <id>_config_rec
-
-        conf_file = ut.join(self.main_win.experiment_dir, 'conf', 'config_rec')
-        new_conf_file = ut.join(self.main_win.experiment_dir, 'conf', f'config_rec_{id}')
+        conf_file = ut.join(self.main_win.experiment_conf_dir, 'config_rec')
+        new_conf_file = ut.join(self.main_win.experiment_conf_dir, f'config_rec_{id}')
         shutil.copyfile(conf_file, new_conf_file)
         self.rec_id.setCurrentIndex(self.rec_id.count() - 1)
 
@@ -1211,9 +1496,9 @@ class RecTab(QWidget):
         conf_map = self.get_rec_config()
         if len(conf_map) == 0:
             return
-        conf_dir = ut.join(self.main_win.experiment_dir, 'conf')
+        conf_dir = self.main_win.experiment_conf_dir
 
-        ut.write_config(conf_map, ut.join(conf_dir, conf_file))
+        self.write_rec_conf(conf_map, ut.join(conf_dir, conf_file))
         if str(self.rec_id.currentText()) == 'main':
             self.old_conf_id = ''
         else:
@@ -1225,7 +1510,11 @@ class RecTab(QWidget):
         else:
             conf_file = ut.join(conf_dir, f'config_rec_{self.old_conf_id}')
 
-        conf_map = ut.read_config(conf_file)
+        if conf_file in self.rec_conf_cache:
+            # load_tab may modify the configuration, give it a copy
+            conf_map = dict(self.rec_conf_cache[conf_file])
+        else:
+            conf_map = com.read_config(conf_file)
         if conf_map is None:
             msg_window(f'please check configuration file {conf_file}')
             return
@@ -1245,6 +1534,7 @@ class RecTab(QWidget):
         """
         rec_file = select_file(os.getcwd())
         if rec_file is not None:
+            self.clear_rec_conf_cache()
             conf_map = ut.read_config(rec_file.replace(os.sep, '/'))
             if conf_map is None:
                 msg_window(f'please check configuration file {rec_file}')
@@ -1272,21 +1562,13 @@ class RecTab(QWidget):
         elif not self.main_win.is_exp_set():
             msg_window('the experiment has changed, pres "set experiment" button')
         else:
-            found_file = False
-            for p, d, f in os.walk(self.main_win.experiment_dir):
-                if 'data.tif' in f:
-                    found_file = True
-                    break
-                if 'data.npy' in f:
-                    found_file = True
-                    break
-            if found_file:
+            if processed_file_exists(self.main_win.experiment_dir, 'phasing_data', ('data.tif', 'data.npy')):
                 # find out which configuration should be saved
                 if self.old_conf_id == '':
                     conf_file = 'config_rec'
                     conf_id = None
                 else:
-                    conf_file =  'config_rec_' + self.old_conf_id
+                    conf_file = f'config_rec_{self.old_conf_id}'
                     conf_id = self.old_conf_id
 
                 conf_map = self.get_rec_config()
@@ -1294,13 +1576,12 @@ class RecTab(QWidget):
                     return
 
                 # verify that reconstruction configuration is ok
-                er_msg = ut.verify('config_rec', conf_map)
-                if len(er_msg) > 0:
-                    msg_window(er_msg)
-                    if not self.main_win.no_verify:
-                        return
-                ut.write_config(conf_map, ut.join(self.main_win.experiment_dir, 'conf', conf_file))
+                if not verify_conf(conf_file, conf_map, self.main_win.no_verify):
+                    return
+                self.write_rec_conf(conf_map, ut.join(self.main_win.experiment_conf_dir, conf_file))
                 run_rc.manage_reconstruction(self.main_win.experiment_dir, config_id=conf_id, no_verify=self.main_win.no_verify)
+                # the reconstruction converts the configuration files if they are in older format
+                self.clear_rec_conf_cache()
                 self.notify()
             else:
                 msg_window('Please, run format data in previous tab to activate this function')
@@ -1342,9 +1623,15 @@ class RecTab(QWidget):
         # fill out the config_id choice bar by reading configuration files names
         if not self.main_win.is_exp_set():
             return
-        for file in os.listdir(ut.join(self.main_win.experiment_dir, 'conf')):
-            if file.startswith('config_rec_'):
-                self.rec_ids.append(file[len('config_rec_') : len(file)])
+        # the ids are scanned again only if the conf directory changed
+        conf_dir = self.main_win.experiment_conf_dir
+        conf_dir_mtime = os.stat(conf_dir).st_mtime_ns
+        if self.rec_ids_scan is None or self.rec_ids_scan[0] != (conf_dir, conf_dir_mtime):
+            with os.scandir(conf_dir) as entries:
+                ids = sorted(entry.name[len('config_rec_'):] for entry in entries
+                             if entry.name.startswith('config_rec_') and entry.is_file(follow_symlinks=False))
+            self.rec_ids_scan = ((conf_dir, conf_dir_mtime), ids)
+        self.rec_ids = list(self.rec_ids_scan[1])
         if len(self.rec_ids) > 0:
             self.rec_id.addItems(self.rec_ids)
             self.rec_id.show()
@@ -1358,6 +1645,13 @@ class Feature(object):
     """
     This is a parent class to concrete feature classes.
     """
+    # parameter which presence in configuration means the feature is active, set in concrete class
+    active_key = None
+    # (attribute, parameter, label, default value) for parameters edited in QLineEdit, set in concrete class
+    fields = ()
+    # maps parameter to function parsing the text, parameters not included are parsed with ast.literal_eval
+    parsers = {}
+
     def __init__(self):
         """
         Constructor, each feature object contains QWidget.
@@ -1387,45 +1681,59 @@ class Feature(object):
         layout = QFormLayout()
         self.active = QCheckBox("active")
         layout.addWidget(self.active)
-        self.toggle(layout, item, feats)
+        # the parameters are created once, and shown when the feature is active
+        self.active_panel = QWidget()
+        panel_layout = QFormLayout(self.active_panel)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        self.fill_active(panel_layout)
+        self.default_button = QPushButton('set to defaults', feats)
+        panel_layout.addWidget(self.default_button)
+        self.default_button.clicked.connect(self.rec_default)
+        layout.addWidget(self.active_panel)
+        self.toggle(item)
         self.stack.setLayout(layout)
-        self.active.stateChanged.connect(lambda: self.toggle(layout, item, feats))
+        self.active.stateChanged.connect(lambda: self.toggle(item))
 
 
-    def toggle(self, layout, item, feats):
+    def toggle(self, item):
         """
         Used by sub-classes (features) when a feature is activated or deactivated.
         Parameters
         ----------
         item : item from QListWidget
             item represents a feature
-        feats : Features object
-            Features object is a composition of features
         Returns
         -------
         nothing
         """
         if self.active.isChecked():
-            self.fill_active(layout)
-
-            self.default_button = QPushButton('set to defaults', feats)
-            layout.addWidget(self.default_button)
-            self.default_button.clicked.connect(self.rec_default)
-
+            self.active_panel.show()
             item.setForeground(QColor('black'));
         else:
-            self.clear_params(layout, item)
+            self.active_panel.hide()
+            item.setForeground(QColor('grey'));
 
 
-    def clear_params(self, layout, item):
-        for i in reversed(range(1, layout.count())):
-            layout.itemAt(i).widget().setParent(None)
-        item.setForeground(QColor('grey'));
+    def clear(self):
+        """
+        Deactivates the feature and clears its parameters.
+        Parameters
+        ----------
+        none
+        Returns
+        -------
+        nothing
+        """
+        self.active.setChecked(False)
+        for widget in self.active_panel.findChildren(QLineEdit):
+            widget.setText('')
+        for widget in self.active_panel.findChildren(QCheckBox):
+            widget.setChecked(False)
 
 
     def fill_active(self, layout):
         """
-        This function is overriden in concrete class. It displays the feature's parameters when the feature becomes active.
+        It displays the feature's parameters listed in fields when the feature becomes active.
         Parameters
         ----------
         layout : Layout widget
@@ -1434,12 +1742,15 @@ class Feature(object):
         -------
         nothing
         """
-        pass
+        for attr, _, label, _ in self.fields:
+            widget = QLineEdit()
+            setattr(self, attr, widget)
+            layout.addRow(label, widget)
 
 
     def rec_default(self):
         """
-        This function is overriden in concrete class. It sets feature's parameters to hardcoded default values.
+        It sets feature's parameters to hardcoded default values from fields.
         Parameters
         ----------
         none
@@ -1447,7 +1758,9 @@ class Feature(object):
         -------
         nothing
         """
-        pass
+        for attr, _, _, default in self.fields:
+            if default is not None:
+                getattr(self, attr).setText(default)
 
 
     def add_config(self, conf_map):
@@ -1467,7 +1780,7 @@ class Feature(object):
 
     def add_feat_conf(self, conf_map):
         """
-        This function is overriden in concrete class. It adds feature's parameters to dictionary.
+        It adds feature's parameters that are not empty to dictionary.
         Parameters
         ----------
         conf_map : dict
@@ -1476,12 +1789,16 @@ class Feature(object):
         -------
         nothing
         """
-        pass
+        for attr, key, _, _ in self.fields:
+            text = getattr(self, attr).text()
+            if len(text) > 0:
+                conf_map[key] = self.parsers.get(key, ast.literal_eval)(text)
 
 
     def init_config(self, conf_map):
         """
-        This function is overriden in concrete class. It sets feature's parameters to parameters in dictionary and displays in the window.
+        It sets feature's parameters to parameters in dictionary and displays in the window. The feature is active
+        if the active_key parameter is configured.
         Parameters
         ----------
         conf_map : dict
@@ -1490,13 +1807,28 @@ class Feature(object):
         -------
         nothing
         """
-        pass
+        if self.active_key not in conf_map:
+            self.active.setChecked(False)
+            return
+        self.active.setChecked(True)
+        for attr, key, _, _ in self.fields:
+            set_if(getattr(self, attr), conf_map, key, clear=True)
 
 
 class GA(Feature):
     """
     This class encapsulates GA feature.
     """
+    active_key = 'ga_generations'
+    fields = (('generations', 'ga_generations', 'generations', '3'),
+              ('metrics', 'ga_metrics', 'fitness metrics', '["chi"]'),
+              ('breed_modes', 'ga_breed_modes', 'breed modes', '["sqrt_ab"]'),
+              ('removes', 'ga_cullings', 'cullings', None),
+              ('ga_sw_thresholds', 'ga_sw_thresholds', 'after breed support thresholds', '[.1]'),
+              ('ga_sw_gauss_sigmas', 'ga_sw_gauss_sigmas', 'after breed shrink wrap sigmas', '[1.0]'),
+              ('lr_sigmas', 'ga_lpf_sigmas', 'low resolution sigmas', None),
+              ('gen_pc_start', 'ga_gen_pc_start', 'gen to start pcdi', '3'))
+
     def __init__(self):
         super(GA, self).__init__()
         self.id = 'GA'
@@ -1517,49 +1849,9 @@ class GA(Feature):
         -------
         nothing
         """
-        if 'ga_generations' in conf_map:
-            gens = conf_map['ga_generations']
-            self.active.setChecked(True)
-            self.generations.setText(str(gens).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'ga_fast' in conf_map:
-            ga_fast = conf_map['ga_fast']
-            if ga_fast:
-                self.ga_fast.setChecked(True)
-            else:
-                self.ga_fast.setChecked(False)
-        else:
-            self.ga_fast.setChecked(False)
-        if 'ga_metrics' in conf_map:
-            self.metrics.setText(str(conf_map['ga_metrics']).replace(" ", ""))
-        else:
-            self.metrics.setText('')
-        if 'ga_breed_modes' in conf_map:
-            self.breed_modes.setText(str(conf_map['ga_breed_modes']).replace(" ", ""))
-        else:
-            self.breed_modes.setText('')
-        if 'ga_cullings' in conf_map:
-            self.removes.setText(str(conf_map['ga_cullings']).replace(" ", ""))
-        else:
-            self.removes.setText('')
-        if 'ga_sw_thresholds' in conf_map:
-            self.ga_sw_thresholds.setText(str(conf_map['ga_sw_thresholds']).replace(" ", ""))
-        else:
-            self.ga_sw_thresholds.setText('')
-        if 'ga_sw_gauss_sigmas' in conf_map:
-            self.ga_sw_gauss_sigmas.setText(str(conf_map['ga_sw_gauss_sigmas']).replace(" ", ""))
-        else:
-            self.ga_sw_gauss_sigmas.setText('')
-        if 'ga_lpf_sigmas' in conf_map:
-            self.lr_sigmas.setText(str(conf_map['ga_lpf_sigmas']).replace(" ", ""))
-        else:
-            self.lr_sigmas.setText('')
-        if 'ga_gen_pc_start' in conf_map:
-            self.gen_pc_start.setText(str(conf_map['ga_gen_pc_start']).replace(" ", ""))
-        else:
-            self.gen_pc_start.setText('')
+        super(GA, self).init_config(conf_map)
+        if self.active.isChecked():
+            self.ga_fast.setChecked(bool(conf_map.get('ga_fast', False)))
 
 
     def fill_active(self, layout):
@@ -1576,22 +1868,7 @@ class GA(Feature):
         self.ga_fast = QCheckBox("fast processing, size limited")
         self.ga_fast.setChecked(False)
         layout.addWidget(self.ga_fast)
-        self.generations = QLineEdit()
-        layout.addRow("generations", self.generations)
-        self.metrics = QLineEdit()
-        layout.addRow("fitness metrics", self.metrics)
-        self.breed_modes = QLineEdit()
-        layout.addRow("breed modes", self.breed_modes)
-        self.removes = QLineEdit()
-        layout.addRow("cullings", self.removes)
-        self.ga_sw_thresholds = QLineEdit()
-        layout.addRow("after breed support thresholds", self.ga_sw_thresholds)
-        self.ga_sw_gauss_sigmas = QLineEdit()
-        layout.addRow("after breed shrink wrap sigmas", self.ga_sw_gauss_sigmas)
-        self.lr_sigmas = QLineEdit()
-        layout.addRow("low resolution sigmas", self.lr_sigmas)
-        self.gen_pc_start = QLineEdit()
-        layout.addRow("gen to start pcdi", self.gen_pc_start)
+        super(GA, self).fill_active(layout)
 
 
     def rec_default(self):
@@ -1604,12 +1881,7 @@ class GA(Feature):
         -------
         nothing
         """
-        self.generations.setText('3')
-        self.metrics.setText('["chi"]')
-        self.breed_modes.setText('["sqrt_ab"]')
-        self.ga_sw_thresholds.setText('[.1]')
-        self.ga_sw_gauss_sigmas.setText('[1.0]')
-        self.gen_pc_start.setText('3')
+        super(GA, self).rec_default()
         self.active.setChecked(True)
 
 
@@ -1626,61 +1898,23 @@ class GA(Feature):
         """
         if self.ga_fast.isChecked():
             conf_map['ga_fast'] = True
-        if len(self.generations.text()) > 0:
-            conf_map['ga_generations'] = ast.literal_eval(str(self.generations.text()))
-        if len(self.metrics.text()) > 0:
-         conf_map['ga_metrics'] = ast.literal_eval(str(self.metrics.text()).replace(os.linesep,''))
-        if len(self.breed_modes.text()) > 0:
-          conf_map['ga_breed_modes'] = ast.literal_eval(str(self.breed_modes.text()).replace(os.linesep,''))
-        if len(self.removes.text()) > 0:
-           conf_map['ga_cullings'] = ast.literal_eval(str(self.removes.text()).replace(os.linesep,''))
-        if len(self.ga_sw_thresholds.text()) > 0:
-            conf_map['ga_sw_thresholds'] = ast.literal_eval(str(self.ga_sw_thresholds.text()).replace(os.linesep,''))
-        if len(self.ga_sw_gauss_sigmas.text()) > 0:
-            conf_map['ga_sw_gauss_sigmas'] = ast.literal_eval(str(self.ga_sw_gauss_sigmas.text()).replace(os.linesep,''))
-        if len(self.lr_sigmas.text()) > 0:
-            conf_map['ga_lpf_sigmas'] = ast.literal_eval(str(self.lr_sigmas.text()).replace(os.linesep,''))
-        if len(self.gen_pc_start.text()) > 0:
-            conf_map['ga_gen_pc_start'] = ast.literal_eval(str(self.gen_pc_start.text()))
+        super(GA, self).add_feat_conf(conf_map)
 
 
 class low_resolution(Feature):
     """
     This class encapsulates low resolution feature.
     """
+    active_key = 'lowpass_filter_trigger'
+    fields = (('lpf_triggers', 'lowpass_filter_trigger', 'lowpass filter triggers', '[0, 1, 320]'),
+              ('lpf_sw_threshold', 'lowpass_filter_sw_threshold', 'shrink wrap threshold', '.1'),
+              ('lpf_range', 'lowpass_filter_range', 'lowpass filter range', '[.7]'))
+
     def __init__(self):
         super(low_resolution, self).__init__()
         self.id = 'low resolution'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets low resolution feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'lowpass_filter_trigger' in conf_map:
-            triggers = conf_map['lowpass_filter_trigger']
-            self.active.setChecked(True)
-            self.lpf_triggers.setText(str(triggers).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'lowpass_filter_sw_threshold' in conf_map:
-            self.lpf_sw_threshold.setText(str(conf_map['lowpass_filter_sw_threshold']).replace(" ", ""))
-        else:
-            self.lpf_sw_threshold.setText('')
-        if 'lowpass_filter_range' in conf_map:
-            self.lpf_range.setText(str(conf_map['lowpass_filter_range']).replace(" ", ""))
-        else:
-            self.lpf_range.setText('')
-
-
     def fill_active(self, layout):
         """
         This function displays the feature's parameters when the feature becomes active.
@@ -1692,194 +1926,63 @@ class low_resolution(Feature):
         -------
         nothing
         """
-        self.lpf_triggers = QLineEdit()
-        layout.addRow("lowpass filter triggers", self.lpf_triggers)
+        super(low_resolution, self).fill_active(layout)
         self.lpf_triggers.setToolTip('suggested trigger: [0, 1, <half iteration number>]')
-        self.lpf_sw_threshold = QLineEdit()
-        layout.addRow("shrink wrap threshold", self.lpf_sw_threshold)
-        self.lpf_range = QLineEdit()
-        layout.addRow("lowpass filter range", self.lpf_range)
 
 
-    def rec_default(self):
-        """
-        This function sets low resolution feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.lpf_triggers.setText('[0, 1, 320]')
-        self.lpf_sw_threshold.setText('.1')
-        self.lpf_range.setText('[.7]')
-
-
-    def add_feat_conf(self, conf_map):
-        """
-        This function adds low resolution feature's parameters to dictionary.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if len(self.lpf_triggers.text()) > 0:
-            conf_map['lowpass_filter_trigger'] = ast.literal_eval(str(self.lpf_triggers.text()).replace(os.linesep, ''))
-        if len(self.lpf_sw_threshold.text()) > 0:
-            conf_map['lowpass_filter_sw_threshold'] = ast.literal_eval(str(self.lpf_sw_threshold.text()).replace(os.linesep, ''))
-        if len(self.lpf_range.text()) > 0:
-            conf_map['lowpass_filter_range'] = ast.literal_eval(str(self.lpf_range.text()).replace(os.linesep, ''))
+def parse_shrink_wrap_type(text):
+    """
+    Parses shrink wrap algorithm, a single name, or a list of names when there are multiple shrink wraps.
+    Parameters
+    ----------
+    text : str
+        text entered in window
+    Returns
+    -------
+    str or list of str
+        shrink wrap algorithm(s)
+    """
+    sw_type = text.translate(com.no_spaces)
+    # in case of multiple shrink wraps the shrink_wrap_type is a list of strings
+    if sw_type.startswith('['):
+        if sw_type.startswith('["') or sw_type.startswith(("['")):
+            return ast.literal_eval(sw_type)
+        else: # parse as one string
+            sw_type = sw_type.replace('[', '["').replace(',', '","').replace(']', '"]')
+            return ast.literal_eval(sw_type)
+    return sw_type
 
 
 class shrink_wrap(Feature):
     """
     This class encapsulates support feature.
     """
+    active_key = 'shrink_wrap_trigger'
+    fields = (('shrink_wrap_triggers', 'shrink_wrap_trigger', 'shrink wrap triggers', '[1,1]'),
+              ('shrink_wrap_type', 'shrink_wrap_type', 'shrink wrap algorithm', 'GAUSS'),
+              ('shrink_wrap_threshold', 'shrink_wrap_threshold', 'shrink wrap threshold', '0.1'),
+              ('shrink_wrap_gauss_sigma', 'shrink_wrap_gauss_sigma', 'shrink wrap Gauss sigma', '1.0'))
+    parsers = {'shrink_wrap_type': parse_shrink_wrap_type}
+
     def __init__(self):
         super(shrink_wrap, self).__init__()
         self.id = 'shrink wrap'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets support feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'shrink_wrap_trigger' in conf_map:
-            triggers = conf_map['shrink_wrap_trigger']
-            self.active.setChecked(True)
-            self.shrink_wrap_triggers.setText(str(triggers).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'shrink_wrap_type' in conf_map:
-            self.shrink_wrap_type.setText(str(conf_map['shrink_wrap_type']).replace(" ", ""))
-        else:
-            self.shrink_wrap_type.setText('')
-        if 'shrink_wrap_threshold' in conf_map:
-            self.shrink_wrap_threshold.setText(str(conf_map['shrink_wrap_threshold']).replace(" ", ""))
-        else:
-            self.shrink_wrap_threshold.setText('')
-        if 'shrink_wrap_gauss_sigma' in conf_map:
-            self.shrink_wrap_gauss_sigma.setText(str(conf_map['shrink_wrap_gauss_sigma']).replace(" ", ""))
-        else:
-            self.shrink_wrap_gauss_sigma.setText('')
-
-
-    def fill_active(self, layout):
-        """
-        This function displays the feature's parameters when the feature becomes active.
-        Parameters
-        ----------
-        layout : Layout widget
-            a layout with the feature
-        Returns
-        -------
-        nothing
-        """
-        self.shrink_wrap_triggers = QLineEdit()
-        layout.addRow("shrink wrap triggers", self.shrink_wrap_triggers)
-        self.shrink_wrap_type = QLineEdit()
-        layout.addRow("shrink wrap algorithm", self.shrink_wrap_type)
-        self.shrink_wrap_threshold = QLineEdit()
-        layout.addRow("shrink wrap threshold", self.shrink_wrap_threshold)
-        self.shrink_wrap_gauss_sigma = QLineEdit()
-        layout.addRow("shrink wrap Gauss sigma", self.shrink_wrap_gauss_sigma)
-
-
-    def rec_default(self):
-        """
-        This function sets support feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.shrink_wrap_triggers.setText('[1,1]')
-        self.shrink_wrap_type.setText('GAUSS')
-        self.shrink_wrap_gauss_sigma.setText('1.0')
-        self.shrink_wrap_threshold.setText('0.1')
-
-
-    def add_feat_conf(self, conf_map):
-        """
-        This function adds support feature's parameters to dictionary.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if len(self.shrink_wrap_triggers.text()) > 0:
-            conf_map['shrink_wrap_trigger'] = ast.literal_eval(str(self.shrink_wrap_triggers.text()).replace(os.linesep,''))
-        if len(self.shrink_wrap_type.text()) > 0:
-            sw_type = str(self.shrink_wrap_type.text()).replace(' ','')
-            # in case of multiple shrink wraps the shrink_wrap_type is a list of strings
-            if sw_type.startswith('['):
-                if sw_type.startswith('["') or sw_type.startswith(("['")):
-                    conf_map['shrink_wrap_type'] = ast.literal_eval(sw_type)
-                else: # parse as one string
-                    sw_type = sw_type.replace('[', '["').replace(',', '","').replace(']', '"]')
-                    conf_map['shrink_wrap_type'] = ast.literal_eval(sw_type)
-            else:
-                conf_map['shrink_wrap_type'] = sw_type
-        if len(self.shrink_wrap_threshold.text()) > 0:
-            conf_map['shrink_wrap_threshold'] = ast.literal_eval(str(self.shrink_wrap_threshold.text()))
-        if len(self.shrink_wrap_gauss_sigma.text()) > 0:
-            conf_map['shrink_wrap_gauss_sigma'] = ast.literal_eval(str(self.shrink_wrap_gauss_sigma.text()))
-
-
 class phase_constrain(Feature):
     """
     This class encapsulates phase constrain feature.
     """
+    active_key = 'phc_trigger'
+    fields = (('phase_triggers', 'phc_trigger', 'phase constrain triggers', '[1,5,320]'),
+              ('phc_phase_min', 'phc_phase_min', 'phase minimum', '-1.57'),
+              ('phc_phase_max', 'phc_phase_max', 'phase maximum', '1.57'))
+
     def __init__(self):
         super(phase_constrain, self).__init__()
         self.id = 'phase constrain'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets phase constrain feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'phc_trigger' in conf_map:
-            triggers = conf_map['phc_trigger']
-            self.active.setChecked(True)
-            self.phase_triggers.setText(str(triggers).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'phc_phase_min' in conf_map:
-            self.phc_phase_min.setText(str(conf_map['phc_phase_min']).replace(" ", ""))
-        else:
-            self.phc_phase_min.setText('')
-        if 'phc_phase_max' in conf_map:
-            self.phc_phase_max.setText(str(conf_map['phc_phase_max']).replace(" ", ""))
-        else:
-            self.phc_phase_max.setText('')
-
-
     def fill_active(self, layout):
         """
         This function displays the feature's parameters when the feature becomes active.
@@ -1891,133 +1994,28 @@ class phase_constrain(Feature):
         -------
         nothing
         """
-        self.phase_triggers = QLineEdit()
-        layout.addRow("phase constrain triggers", self.phase_triggers)
+        super(phase_constrain, self).fill_active(layout)
         self.phase_triggers.setToolTip('suggested trigger: [0, 1, <half iteration number>]')
-        self.phc_phase_min = QLineEdit()
-        layout.addRow("phase minimum", self.phc_phase_min)
-        self.phc_phase_max = QLineEdit()
-        layout.addRow("phase maximum", self.phc_phase_max)
-
-
-    def rec_default(self):
-        """
-        This function sets phase constrain feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.phase_triggers.setText('[1,5,320]')
-        self.phc_phase_min.setText('-1.57')
-        self.phc_phase_max.setText('1.57')
-
-
-    def add_feat_conf(self, conf_map):
-        """
-        This function adds phase constrain feature's parameters to dictionary.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if len(self.phase_triggers.text()) > 0:
-            conf_map['phc_trigger'] = ast.literal_eval(str(self.phase_triggers.text()).replace(os.linesep,''))
-        if len(self.phc_phase_min.text()) > 0:
-            conf_map['phc_phase_min'] = ast.literal_eval(str(self.phc_phase_min.text()))
-        if len(self.phc_phase_max.text()) > 0:
-            conf_map['phc_phase_max'] = ast.literal_eval(str(self.phc_phase_max.text()))
 
 
 class pcdi(Feature):
     """
     This class encapsulates pcdi feature.
     """
+    active_key = 'pc_interval'
+    fields = (('pc_interval', 'pc_interval', 'pc interval', '50'),
+              ('pc_type', 'pc_type', 'partial coherence algorithm', 'LUCY'),
+              ('pc_iter', 'pc_LUCY_iterations', 'LUCY iteration number', '20'),
+              ('pc_normalize', 'pc_normalize', 'normalize', 'True'),
+              ('pc_LUCY_kernel', 'pc_LUCY_kernel', 'LUCY kernel area', '[16, 16, 16]'))
+    parsers = {'pc_type': str,
+               'pc_normalize': lambda text: text.strip() != 'False'}
+
     def __init__(self):
         super(pcdi, self).__init__()
         self.id = 'pcdi'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets pcdi feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'pc_interval' in conf_map:
-            self.active.setChecked(True)
-            self.pc_interval.setText(str(conf_map['pc_interval']).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'pc_type' in conf_map:
-            self.pc_type.setText(str(conf_map['pc_type']).replace(" ", ""))
-        else:
-            self.pc_type.setText('')
-        if 'pc_LUCY_iterations' in conf_map:
-            self.pc_iter.setText(str(conf_map['pc_LUCY_iterations']).replace(" ", ""))
-        else:
-            self.pc_iter.setText('')
-        if 'pc_normalize' in conf_map:
-            self.pc_normalize.setText(str(conf_map['pc_normalize']).replace(" ", ""))
-        else:
-            self.pc_normalize.setText('')
-        if 'pc_LUCY_kernel' in conf_map:
-            self.pc_LUCY_kernel.setText(str(conf_map['pc_LUCY_kernel']).replace(" ", ""))
-        else:
-            self.pc_LUCY_kernel.setText('')
-
-
-    def fill_active(self, layout):
-        """
-        This function displays the feature's parameters when the feature becomes active.
-        Parameters
-        ----------
-        layout : Layout widget
-            a layout with the feature
-        Returns
-        -------
-        nothing
-        """
-        self.pc_interval = QLineEdit()
-        layout.addRow("pc interval", self.pc_interval)
-        self.pc_type = QLineEdit()
-        layout.addRow("partial coherence algorithm", self.pc_type)
-        self.pc_iter = QLineEdit()
-        layout.addRow("LUCY iteration number", self.pc_iter)
-        self.pc_normalize = QLineEdit()
-        layout.addRow("normalize", self.pc_normalize)
-        self.pc_LUCY_kernel = QLineEdit()
-        layout.addRow("LUCY kernel area", self.pc_LUCY_kernel)
-
-
-    def rec_default(self):
-        """
-        This function sets pcdi feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.pc_interval.setText('50')
-        self.pc_type.setText('LUCY')
-        self.pc_iter.setText('20')
-        self.pc_normalize.setText('True')
-        self.pc_LUCY_kernel.setText('[16, 16, 16]')
-
-
     def add_feat_conf(self, conf_map):
         """
         This function adds pcdi feature's parameters to dictionary.
@@ -2029,230 +2027,120 @@ class pcdi(Feature):
         -------
         nothing
         """
-        if len(self.pc_interval.text()) > 0:
-            conf_map['pc_interval'] = ast.literal_eval(str(self.pc_interval.text()))
-        if len(self.pc_type.text()) > 0:
-            conf_map['pc_type'] = str(self.pc_type.text())
-        if len(self.pc_iter.text()) > 0:
-            conf_map['pc_LUCY_iterations'] = ast.literal_eval(str(self.pc_iter.text()))
-        pc_normalize_txt = str(self.pc_normalize.text()).strip()
-        if pc_normalize_txt == 'False':
-            conf_map['pc_normalize'] = False
-        else:
-            conf_map['pc_normalize'] = True
-        if len(self.pc_LUCY_kernel.text()) > 0:
-            conf_map['pc_LUCY_kernel'] = ast.literal_eval(str(self.pc_LUCY_kernel.text()).replace(os.linesep,''))
+        super(pcdi, self).add_feat_conf(conf_map)
+        # normalize is always configured, True unless set to False
+        conf_map.setdefault('pc_normalize', True)
 
 
 class twin(Feature):
     """
     This class encapsulates twin feature.
     """
+    active_key = 'twin_trigger'
+    fields = (('twin_triggers', 'twin_trigger', 'twin triggers', '[2]'),
+              ('twin_halves', 'twin_halves', 'twin halves', '[0,0]'))
+
     def __init__(self):
         super(twin, self).__init__()
         self.id = 'twin'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets twin feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'twin_trigger' in conf_map:
-            self.active.setChecked(True)
-            self.twin_triggers.setText(str(conf_map['twin_trigger']).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-        if 'twin_halves' in conf_map:
-            self.twin_halves.setText(str(conf_map['twin_halves']).replace(" ", ""))
-        else:
-            self.twin_halves.setText('')
-
-
-    def fill_active(self, layout):
-        """
-        This function displays the feature's parameters when the feature becomes active.
-        Parameters
-        ----------
-        layout : Layout widget
-            a layout with the feature
-        Returns
-        -------
-        nothing
-        """
-        self.twin_triggers = QLineEdit()
-        layout.addRow("twin triggers", self.twin_triggers)
-        self.twin_halves = QLineEdit()
-        layout.addRow("twin halves", self.twin_halves)
-
-
-    def rec_default(self):
-        """
-        This function sets twin feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.twin_triggers.setText('[2]')
-        self.twin_halves.setText('[0,0]')
-
-
-    def add_feat_conf(self, conf_map):
-        """
-        This function adds twin feature's parameters to dictionary.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if len(self.twin_triggers.text()) > 0:
-            conf_map['twin_trigger'] = ast.literal_eval(str(self.twin_triggers.text()).replace(os.linesep,''))
-        if len(self.twin_halves.text()) > 0:
-            conf_map['twin_halves'] = ast.literal_eval(str(self.twin_halves.text()).replace(os.linesep,''))
-
-
 class average(Feature):
     """
     This class encapsulates average feature.
     """
+    active_key = 'average_trigger'
+    fields = (('average_triggers', 'average_trigger', 'average triggers', '[-50,1]'),)
+
     def __init__(self):
         super(average, self).__init__()
         self.id = 'average'
 
 
-    def init_config(self, conf_map):
-        """
-        This function sets average feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        if 'average_trigger' in conf_map:
-            self.active.setChecked(True)
-            self.average_triggers.setText(str(conf_map['average_trigger']).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
-
-
-    def fill_active(self, layout):
-        """
-        This function displays the feature's parameters when the feature becomes active.
-        Parameters
-        ----------
-        layout : Layout widget
-            a layout with the feature
-        Returns
-        -------
-        nothing
-        """
-        self.average_triggers = QLineEdit()
-        layout.addRow("average triggers", self.average_triggers)
-
-
-    def rec_default(self):
-        """
-        This function sets average feature's parameters to hardcoded default values.
-        Parameters
-        ----------
-        none
-        Returns
-        -------
-        nothing
-        """
-        self.average_triggers.setText('[-50,1]')
-
-
-    def add_feat_conf(self, conf_map):
-        """
-        This function adds average feature's parameters to dictionary.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
-        """
-        conf_map['average_trigger'] = ast.literal_eval(str(self.average_triggers.text()).replace(os.linesep,''))
-
-
 class progress(Feature):
     """
     This class encapsulates progress feature.
     """
+    active_key = 'progress_trigger'
+    fields = (('progress_triggers', 'progress_trigger', 'progress triggers', '[0,20]'),)
+
     def __init__(self):
         super(progress, self).__init__()
         self.id = 'progress'
 
 
-    def init_config(self, conf_map):
+class Features(QWidget):
+    """
+    This class is composition of all feature classes.
+    """
+    # feature ids in displayed order with the concrete feature classes
+    feature_specs = (('GA', GA),
+                     ('low resolution', low_resolution),
+                     ('shrink wrap', shrink_wrap),
+                     ('phase constrain', phase_constrain),
+                     ('pcdi', pcdi),
+                     ('twin', twin),
+                     ('average', average),
+                     ('progress', progress))
+
+    def __init__(self, tab, layout):
         """
-        This function sets progress feature's parameters to parameters in dictionary and displays in the window.
-        Parameters
-        ----------
-        conf_map : dict
-            contains parameters for reconstruction
-        Returns
-        -------
-        nothing
+        Constructor, lists all features in window. The concrete feature objects are created when the feature is
+        first displayed or configured.
         """
-        if 'progress_trigger' in conf_map:
-            self.active.setChecked(True)
-            self.progress_triggers.setText(str(conf_map['progress_trigger']).replace(" ", ""))
-        else:
-            self.active.setChecked(False)
-            return
+        super(Features, self).__init__()
+        self.feature_ids = [id for id, _ in self.feature_specs]
+        # maps feature id to its position in the list and stack
+        self.feature_index = {id: i for i, id in enumerate(self.feature_ids)}
+        # created features
+        self.feature_dir = {}
+        self.leftlist = QListWidget()
+        self.Stack = QStackedWidget(self)
+        for i, id in enumerate(self.feature_ids):
+            self.leftlist.insertItem(i, id)
+            self.leftlist.item(i).setForeground(QColor('grey'))
+            # placeholder until the feature is created
+            self.Stack.addWidget(QWidget())
 
+        # the first feature is shown before any is selected
+        self.get_feature(self.feature_ids[0])
 
-    def fill_active(self, layout):
-        """
-        This function displays the feature's parameters when the feature becomes active.
-        Parameters
-        ----------
-        layout : Layout widget
-            a layout with the feature
-        Returns
-        -------
-        nothing
-        """
-        self.progress_triggers = QLineEdit()
-        layout.addRow("progress triggers", self.progress_triggers)
+        layout.addWidget(self.leftlist)
+        layout.addWidget(self.Stack)
 
+        self.leftlist.currentRowChanged.connect(self.display)
 
-    def rec_default(self):
+
+    def get_feature(self, id):
         """
-        This function sets progress feature's parameters to hardcoded default values.
+        Returns feature object, creating it if needed.
         Parameters
         ----------
-        none
+        id : str
+            feature id
         Returns
         -------
-        nothing
+        feature : Feature
+            concrete feature object
         """
-        self.progress_triggers.setText('[0,20]')
+        if id not in self.feature_dir:
+            i = self.feature_index[id]
+            feature = self.feature_specs[i][1]()
+            feature.stackUI(self.leftlist.item(i), self)
+            current = self.Stack.currentIndex()
+            placeholder = self.Stack.widget(i)
+            self.Stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.Stack.insertWidget(i, feature.stack)
+            self.Stack.setCurrentIndex(current)
+            self.feature_dir[id] = feature
+        return self.feature_dir[id]
 
 
-    def add_feat_conf(self, conf_map):
+    def load_config(self, conf_map):
         """
-        This function adds progress feature's parameters to dictionary.
+        Sets features parameters to parameters in dictionary. A feature that was not created yet is created only
+        if it is configured.
         Parameters
         ----------
         conf_map : dict
@@ -2261,43 +2149,13 @@ class progress(Feature):
         -------
         nothing
         """
-        conf_map['progress_trigger'] = ast.literal_eval(str(self.progress_triggers.text()).replace(os.linesep,''))
-
-
-class Features(QWidget):
-    """
-    This class is composition of all feature classes.
-    """
-    def __init__(self, tab, layout):
-        """
-        Constructor, creates all concrete feature objects, and displays in window.
-        """
-        super(Features, self).__init__()
-        feature_ids = ['GA', 'low resolution', 'shrink wrap', 'phase constrain', 'pcdi', 'twin', 'average', 'progress']
-        self.leftlist = QListWidget()
-        self.feature_dir = {'GA' : GA(),
-                            'low resolution' : low_resolution(),
-                            'shrink wrap' : shrink_wrap(),
-                            'phase constrain' : phase_constrain(),
-                            'pcdi' : pcdi(),
-                            'twin' : twin(),
-                            'average' : average(),
-                            'progress' : progress()}
-        self.Stack = QStackedWidget(self)
-        for i in range(len(feature_ids)):
-            id = feature_ids[i]
-            self.leftlist.insertItem(i, id)
-            feature = self.feature_dir[id]
-            feature.stackUI(self.leftlist.item(i), self)
-            self.Stack.addWidget(feature.stack)
-
-        layout.addWidget(self.leftlist)
-        layout.addWidget(self.Stack)
-
-        self.leftlist.currentRowChanged.connect(self.display)
+        for id, feature_class in self.feature_specs:
+            if id in self.feature_dir or feature_class.active_key in conf_map:
+                self.get_feature(id).init_config(conf_map)
 
 
     def display(self, i):
+        self.get_feature(self.feature_ids[i])
         self.Stack.setCurrentIndex(i)
 
 
@@ -2395,7 +2253,7 @@ class MpTab(QWidget):
         nothing
         """
         if 'scan' in conf_map:
-            self.scan.setText(str(conf_map['scan']).replace(" ", ""))
+            self.scan.setText(com.stripped(conf_map['scan']))
         if 'orientations' in conf_map:
             self.orientations.setText(str(conf_map['orientations']))
         if 'hkl_in' in conf_map:
@@ -2434,31 +2292,31 @@ class MpTab(QWidget):
         conf_map = {}
 
         if len(self.scan.text()) > 0:
-            conf_map['scan'] = str(self.scan.text())
+            conf_map['scan'] = self.scan.text()
         if len(self.orientations.text()) > 0:
-            conf_map['orientations'] = ast.literal_eval(str(self.orientations.text()))
+            conf_map['orientations'] = ast.literal_eval(self.orientations.text())
         if len(self.hkl_in.text()) > 0:
-            conf_map['hkl_in'] = ast.literal_eval(str(self.hkl_in.text()))
+            conf_map['hkl_in'] = ast.literal_eval(self.hkl_in.text())
         if len(self.hkl_out.text()) > 0:
-            conf_map['hkl_out'] = ast.literal_eval(str(self.hkl_out.text()))
+            conf_map['hkl_out'] = ast.literal_eval(self.hkl_out.text())
         if len(self.twin_plane.text()) > 0:
-            conf_map['twin_plane'] = ast.literal_eval(str(self.twin_plane.text()))
+            conf_map['twin_plane'] = ast.literal_eval(self.twin_plane.text())
         if len(self.sample_axis.text()) > 0:
-            conf_map['sample_axis'] = ast.literal_eval(str(self.sample_axis.text()))
+            conf_map['sample_axis'] = ast.literal_eval(self.sample_axis.text())
         if len(self.final_size.text()) > 0:
-            conf_map['final_size'] = ast.literal_eval(str(self.final_size.text()))
+            conf_map['final_size'] = ast.literal_eval(self.final_size.text())
         if len(self.mp_max_weight.text()) > 0:
-            conf_map['mp_max_weight'] = ast.literal_eval(str(self.mp_max_weight.text()))
+            conf_map['mp_max_weight'] = ast.literal_eval(self.mp_max_weight.text())
         if len(self.mp_taper.text()) > 0:
-            conf_map['mp_taper'] = ast.literal_eval(str(self.mp_taper.text()))
+            conf_map['mp_taper'] = ast.literal_eval(self.mp_taper.text())
         if len(self.lattice_size.text()) > 0:
-            conf_map['lattice_size'] = ast.literal_eval(str(self.lattice_size.text()))
+            conf_map['lattice_size'] = ast.literal_eval(self.lattice_size.text())
         if len(self.ds_voxel_size.text()) > 0:
-            conf_map['ds_voxel_size'] = ast.literal_eval(str(self.ds_voxel_size.text()))
+            conf_map['ds_voxel_size'] = ast.literal_eval(self.ds_voxel_size.text())
         if len(self.switch_peak_trigger.text()) > 0:
-            conf_map['switch_peak_trigger'] = ast.literal_eval(str(self.switch_peak_trigger.text()))
+            conf_map['switch_peak_trigger'] = ast.literal_eval(self.switch_peak_trigger.text())
 
-        ut.write_config(conf_map, self.main_win.experiment_dir + '/conf/config_mp')
+        com.write_config(conf_map, ut.join(self.main_win.experiment_conf_dir, 'config_mp'))
 
 
     def load_mp_conf(self):
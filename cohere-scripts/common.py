@@ -1,5 +1,8 @@
 import sys
 import os
+import importlib
+from functools import lru_cache
+from contextlib import contextmanager
 import convertconfig as conv
 import cohere_core.utilities as ut
 
@@ -26,71 +29,255 @@ def get_config_maps(experiment_dir, configs, config_id=None):
     # always get main config
     conf_dir = ut.join(experiment_dir, 'conf')
     main_conf = ut.join(conf_dir, 'config')
-    if not os.path.isfile(main_conf):
+    conf_files = list_files(conf_dir)
+    if 'config' not in conf_files:
         return maps, None
 
     converted = False
     main_config_map = ut.read_config(main_conf)
     # convert configuration files if different converter version
-    if 'converter_ver' not in main_config_map or conv.get_version() is None or conv.get_version() > main_config_map['converter_ver']:
+    conv_version = conv.get_version()
+    if 'converter_ver' not in main_config_map or conv_version is None or conv_version > main_config_map['converter_ver']:
         conv.convert(conf_dir)
         main_config_map = ut.read_config(main_conf)
         converted = True
+        # conversion may add configuration files
+        conf_files = list_files(conf_dir)
 
     maps['config'] = main_config_map
 
+    # conf_dir is already normalized by ut.join, the file names can be appended directly
+    conf_prefix = conf_dir + '/'
+    conf_paths = {}
     for conf in configs:
         # special case for rec_id
         if config_id is not None and (conf == 'config_rec' or conf == 'config_disp'):
-            conf_file = ut.join(experiment_dir, 'conf', f'{conf}_{config_id}')
+            conf_name = f'{conf}_{config_id}'
         else:
-            conf_file = ut.join(experiment_dir, 'conf', conf)
+            conf_name = conf
 
-        if not os.path.isfile(conf_file):
-            continue
+        if conf_name in conf_files:
+            conf_paths[conf] = conf_prefix + conf_name
 
-        config_map = ut.read_config(conf_file)
+    if len(conf_paths) > 1:
+        # the files are independent, overlap reading them
+        from concurrent.futures import ThreadPoolExecutor
 
-        maps[conf] = config_map
+        with ThreadPoolExecutor(max_workers=len(conf_paths)) as executor:
+            config_maps = executor.map(ut.read_config, conf_paths.values())
+            maps.update(zip(conf_paths.keys(), config_maps))
+    else:
+        for conf, conf_path in conf_paths.items():
+            maps[conf] = ut.read_config(conf_path)
 
     return maps, converted
 
 
+@lru_cache(maxsize=None)
+def get_beamlines():
+    """
+    Finds the beamline packages in beamlines directory. The directory is searched once.
+
+    :return:
+        set of beamline names
+    """
+    import pkgutil
+    import beamlines
+
+    return {info.name for info in pkgutil.iter_modules(beamlines.__path__) if info.ispkg}
+
+
+@lru_cache(maxsize=None)
+def get_beam_module(beamline, module):
+    """
+    Imports module of the beamline package. The imported modules are kept, so repeated calls do not go through
+    the import machinery.
+
+    :param beamline: str
+        beamline name, the package in beamlines directory
+    :param module: str
+        module name, i.e. 'instrument', 'preprocessor', 'beam_verifier'
+    :return:
+        imported module
+    """
+    # unknown beamline fails without searching for the module, failed imports are not cached
+    if beamline not in get_beamlines():
+        raise ValueError(f'beamline {beamline} is not supported')
+    return importlib.import_module(f'beamlines.{beamline}.{module}')
+
+
+def list_files(dir):
+    """
+    Returns names of files in the directory. The directory is read once, instead of checking each file.
+
+    :param dir: str
+        directory name
+    :return:
+        set of file names, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+# configuration files content collected by write_config while inside batched_writes context, None otherwise
+pending_writes = None
+
+# translation table deleting spaces, used when displaying configuration values
+no_spaces = str.maketrans('', '', ' ')
+# translation table deleting line separators, used when reading parameters from the window
+no_newlines = str.maketrans('', '', '\r\n')
+# translation table deleting all whitespace in one pass, used for values that become part of a name
+no_whitespace = str.maketrans('', '', ' \t\r\n')
+
+
+def stripped(value):
+    """
+    Returns string representation of the value with spaces removed.
+
+    :param value: configuration parameter value, string, number, or list
+    :return: string without spaces
+    """
+    value = str(value)
+    # most values have no spaces, skip creating a copy then
+    if ' ' in value:
+        return value.translate(no_spaces)
+    return value
+
+
+# parsed configuration files, maps file name to ((modification time, size), configuration dictionary)
+read_configs = {}
+
+
+def read_config(conf_file):
+    """
+    Reads configuration file and returns configuration dictionary. The parsed configuration is cached and reused
+    as long as the file modification time and size do not change.
+
+    :param conf_file: str
+        configuration file name
+    :return:
+        configuration dictionary or None if the file could not be parsed
+    """
+    try:
+        st = os.stat(conf_file)
+    except OSError:
+        return ut.read_config(conf_file)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = read_configs.get(conf_file)
+    if cached is None or cached[0] != key:
+        conf_map = ut.read_config(conf_file)
+        if conf_map is None:
+            read_configs.pop(conf_file, None)
+            return None
+        cached = (key, conf_map)
+        read_configs[conf_file] = cached
+    # return a copy, so the caller can modify it
+    return dict(cached[1])
+
+
+def write_config(conf_map, conf_file):
+    """
+    Writes configuration dictionary to a file in the format parsed by cohere_core read_config.
+    The file content is assembled in memory and written with a single write. When called inside batched_writes
+    context the write is deferred until the context exits.
+
+    :param conf_map: dict
+        configuration parameters
+    :param conf_file: str
+        configuration file name
+    """
+    lines = []
+    for key, value in conf_map.items():
+        if type(value) == str:
+            value = f'"{value}"'
+        lines.append(f'{key} = {value}\n')
+    if pending_writes is not None:
+        pending_writes[conf_file] = ''.join(lines)
+    else:
+        write_file(conf_file, ''.join(lines))
+
+
+def write_file(file_name, content):
+    """
+    Writes the content to a file, replacing previous content. The file is opened in truncating mode and the content
+    is written with a single write.
+
+    :param file_name: str
+        name of the file
+    :param content: str
+        text to write
+    """
+    read_configs.pop(file_name, None)
+    with open(file_name, 'w') as f:
+        f.write(content)
+
+
+@contextmanager
+def batched_writes():
+    """
+    Context in which write_config collects the configuration files content. The files are written when the context
+    exits normally, each file once, with the last content. If the context exits with exception nothing is written.
+    Nested contexts are part of the outermost one.
+    """
+    global pending_writes
+    if pending_writes is not None:
+        yield
+        return
+    pending_writes = {}
+    try:
+        yield
+        writes = pending_writes
+    finally:
+        pending_writes = None
+    for conf_file, content in writes.items():
+        write_file(conf_file, content)
+
+
+# maps processing choice to the library that must be importable and the package name passed to cohere_core
+proc_libs = {'cp': ('cupy', 'cp'),
+             'torch': ('torch', 'torch'),
+             'np': (None, 'np')}
+# message returned when the library for requested processing cannot be imported
+missing_lib_msg = {'cp': 'cupy is not installed, select different processing',
+                   'torch': 'pytorch is not installed, select different processing'}
+
+
+@lru_cache(maxsize=None)
+def is_importable(lib):
+    """
+    Tries to import the library once, the result is cached.
+
+    :param lib: library name
+    :return: True if the library was imported, False otherwise
+    """
+    try:
+        importlib.import_module(lib)
+        return True
+    except Exception:
+        return False
+
+
 def get_pkg(proc, dev):
     pkg = 'np'
-    err_msg = ''
 
     if proc == 'auto':
-        if sys.platform == 'darwin':
-            return err_msg, pkg
-        try:
-            import cupy
-            pkg = 'cp'
-        except:
-            try:
-                import torch
-                pkg = 'torch'
-            except:
-                pass
-    elif proc == 'cp':
+        if sys.platform != 'darwin':
+            for p in ('cp', 'torch'):
+                if is_importable(proc_libs[p][0]):
+                    return '', proc_libs[p][1]
+        return '', pkg
+
+    if proc not in proc_libs:
+        return f'invalid "processing" value, {proc} is not supported', pkg
+    if proc == 'cp':
         if sys.platform == 'darwin':
             return 'cupy is not supported by Mac, running with numpy', pkg
         if dev == [-1]:
             return 'when using cupy processing, define device', pkg
-        try:
-            import cupy
-            pkg = 'cp'
-        except:
-            err_msg = 'cupy is not installed, select different processing'
-    elif proc == 'torch':
-        try:
-            import torch
-            pkg = 'torch'
-        except:
-            err_msg = 'pytorch is not installed, select different processing'
-    elif proc == 'np':
-        pass  # lib set to 'np'
-    else:
-        err_msg = f'invalid "processing" value, {proc} is not supported'
-
-    return err_msg, pkg
+    lib, lib_pkg = proc_libs[proc]
+    if lib is not None and not is_importable(lib):
+        return missing_lib_msg[proc], pkg
+    return '', lib_pkg
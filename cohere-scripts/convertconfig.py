@@ -126,19 +126,18 @@ def convert_dict(conf_dicts, prev_ver=0):
                         last_char = ')'
                     else:
                         last_char = '+'
-                    s = s + last_char
+                    s = f'{s}{last_char}'
             return s
 
         alg_seq = conf_dict['algorithm_sequence'].replace(' ','')
         if alg_seq.startswith('('):    # old format
-            s = '"'
+            s = ''
             alg_seq = ast.literal_eval(alg_seq)
             for i in range(len(alg_seq)):
                 s = add_iter(alg_seq[i], s)
                 if i < len(alg_seq)-1:
                     s = f'{s}+'
-            s = s + '"'
-            conf_dict['algorithm_sequence'] = s
+            conf_dict['algorithm_sequence'] = f'"{s}"'
 
         pc_interval = conf_dict['pc_interval'].replace(' ','')
         if not pc_interval.isnumeric():
@@ -14,25 +14,31 @@ __author__ = "Barbara Frosik"
 __copyright__ = "Copyright (c), UChicago Argonne, LLC."
 __docformat__ = 'restructuredtext en'
 __all__ = ['run_all',
+           'run_many',
            'main']
 
-import beamline_preprocess as prep
-import standard_preprocess as dt
-import run_reconstruction as rec
-import beamline_visualization as dsp
 import os
 import argparse
+import importlib
+
+# processing steps in order of execution, (module, function)
+steps = (('beamline_preprocess', 'handle_prep'),
+         ('standard_preprocess', 'format_data'),
+         ('run_reconstruction', 'manage_reconstruction'),
+         ('beamline_visualization', 'handle_visualization'))
+# paths need converting to forward slashes only on systems with a different separator
+convert_sep = os.sep != '/'
 
 def run_all(experiment_dir, **kwargs):
     """
-    Creates a "config_prep" file with some parameters commented out.
+    Runs all processing steps for the experiment. If a step returns an error message, the message is printed.
 
     Parameters
     ----------
     dev : str
         processing library, choices are: cpu, cuda, opencl
     experiment_dir : str
-        directory where the experiment files are loacted
+        directory where the experiment files are located
     config_id : str
         optional, if given, alternate configuration file will be used for reconstruction, (i.e. <config_id>_config_rec)
 
@@ -40,22 +46,116 @@ def run_all(experiment_dir, **kwargs):
     -------
     nothing
     """
-    experiment_dir = experiment_dir.replace(os.sep, '/')
-    prep.handle_prep(experiment_dir, **kwargs)
-    dt.format_data(experiment_dir, **kwargs)
-    rec.manage_reconstruction(experiment_dir, **kwargs)
-    dsp.handle_visualization(experiment_dir, **kwargs)
+    if convert_sep:
+        experiment_dir = experiment_dir.replace(os.sep, '/')
+    for step in steps:
+        msg = run_step(step, experiment_dir, kwargs)
+        if is_error(msg):
+            print(f'processing {experiment_dir} failed:', msg)
+
+
+def is_error(result):
+    """
+    Tells if the value returned by step function is an error. The step functions return non-empty message when
+    failed.
+
+    Parameters
+    ----------
+    result : any
+        value returned by step function
+
+    Returns
+    -------
+    boolean
+        True if the step failed
+    """
+    return isinstance(result, str) and len(result) > 0
+
+
+def run_step(step, experiment_dir, kwargs):
+    """
+    Runs one processing step for the experiment. The processing modules load heavy libraries, the module is
+    imported when its step is run. Used by run_all, and by run_many in the step worker process.
+
+    Parameters
+    ----------
+    step : tuple
+        (module, function) from steps
+    experiment_dir : str
+        directory where the experiment files are located
+    kwargs : dict
+        keyword arguments passed to the step function
+
+    Returns
+    -------
+    result
+        value returned by the step function, error message if failed
+    """
+    module_name, func_name = step
+    return getattr(importlib.import_module(module_name), func_name)(experiment_dir, **kwargs)
+
+
+def run_many(experiment_dirs, **kwargs):
+    """
+    Runs all processing steps for each of the experiments. The steps are pipelined: each step runs in its own
+    worker process, so while one experiment is reconstructed the next one can be formatted, and another one
+    preprocessed. Each experiment goes through the steps in order, and each step processes one experiment at
+    a time. If a step fails for an experiment, the following steps are not run for it.
+
+    Parameters
+    ----------
+    experiment_dirs : list
+        directories where the experiments files are located
+    config_id : str
+        optional, if given, alternate configuration file will be used for reconstruction, (i.e. <config_id>_config_rec)
+
+    Returns
+    -------
+    nothing
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if convert_sep:
+        experiment_dirs = [experiment_dir.replace(os.sep, '/') for experiment_dir in experiment_dirs]
+    if len(experiment_dirs) == 1:
+        run_all(experiment_dirs[0], **kwargs)
+        return
+
+    executors = [ProcessPoolExecutor(max_workers=1) for _ in steps]
+    failed = set()
+    try:
+        # in each wave step i processes the experiment that finished step i-1 in previous wave
+        for wave in range(len(experiment_dirs) + len(steps) - 1):
+            futures = {}
+            for i, step in enumerate(steps):
+                exp_no = wave - i
+                if 0 <= exp_no < len(experiment_dirs) and exp_no not in failed:
+                    futures[exp_no] = executors[i].submit(run_step, step, experiment_dirs[exp_no], kwargs)
+            for exp_no, future in futures.items():
+                try:
+                    msg = future.result()
+                except Exception as e:
+                    msg = e
+                else:
+                    if not is_error(msg):
+                        continue
+                print(f'processing {experiment_dirs[exp_no]} failed:', msg)
+                failed.add(exp_no)
+    finally:
+        for executor in executors:
+            executor.shutdown()
 
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("experiment_dir", help="experiment directory")
+    parser.add_argument("experiment_dir", nargs='+',
+                        help="experiment directory, if more are given the experiments are processed in pipeline")
     parser.add_argument("--config_id", help="reconstruction id, a prefix to '_results' directory")
     parser.add_argument("--no_verify", action="store_true",
                         help="if True the vrifier has no effect on processing")
 
     args = parser.parse_args()
-    run_all(args.experiment_dir, config_id=args.config_id, no_verify=args.no_verify)
+    run_many(args.experiment_dir, config_id=args.config_id, no_verify=args.no_verify)
 
 
 if __name__ == "__main__":
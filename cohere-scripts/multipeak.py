@@ -28,6 +28,7 @@ from skimage import transform
 import scipy.ndimage as ndi
 from scipy.spatial.transform import Rotation as R
 import cohere_core.utilities as ut
+import common as com
 
 
 def calc_geometry(instr_obj, shape, scan, o_twin):
@@ -153,7 +154,7 @@ def preprocess(preprocessor, instr_obj, scans_dirs, experiment_dir, mp_conf_map)
     # add the voxel size to config and save
     mp_conf_map["rs_voxel_size"] = rs_voxel_size
     mp_conf_map["ds_voxel_size"] = ds_voxel_size
-    ut.write_config(mp_conf_map, ut.join(experiment_dir, 'conf', 'config_mp'))
+    com.write_config(mp_conf_map, ut.join(experiment_dir, 'conf', 'config_mp'))
 
     # run preprocessor for each batch (data set related to peak)
     processes = []
@@ -173,7 +174,7 @@ def preprocess(preprocessor, instr_obj, scans_dirs, experiment_dir, mp_conf_map)
         save_dir = ut.join(experiment_dir, f'mp_{conf_scans[i]}_{orientation}')
         if not Path(save_dir).exists():
             Path(save_dir).mkdir()
-        ut.write_config(geometry, ut.join(save_dir, 'geometry'))
+        com.write_config(geometry, ut.join(save_dir, 'geometry'))
 
         p = Process(target=preprocessor.process_batch,
                     args=(instr_obj.get_scan_array, batch, ut.join(save_dir, 'preprocessed_data', 'prep_data.tif'),
@@ -143,14 +143,15 @@ def manage_reconstruction(experiment_dir, config_id, no_verify):
 
     # verify that config files are correct
     main_conf_map = conf_maps['config']
-    err_msg = ut.verify('config', main_conf_map)
-    if len(err_msg) > 0:
-        return err_msg
-
     rec_config_map = conf_maps['config_rec']
-    err_msg = ut.verify('config_rec', rec_config_map)
-    if len(err_msg) > 0:
-        return err_msg
+    if not no_verify:
+        err_msg = ut.verify('config', main_conf_map)
+        if len(err_msg) > 0:
+            return err_msg
+
+        err_msg = ut.verify('config_rec', rec_config_map)
+        if len(err_msg) > 0:
+            return err_msg
 
     proc = rec_config_map.get('processing', 'auto')
     devices = rec_config_map.get('device', [-1])
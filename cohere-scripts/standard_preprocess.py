@@ -48,14 +48,14 @@ def format_data(experiment_dir, **kwargs):
 
     # verify that config files are correct
     main_conf_map = conf_maps['config']
-    err_msg = ut.verify('config', main_conf_map)
-    if len(err_msg) > 0:
-        return err_msg
+    if not kwargs.get('no_verify', False):
+        err_msg = ut.verify('config', main_conf_map)
+        if len(err_msg) > 0:
+            return err_msg
 
-    data_config_map = conf_maps['config_data']
-    err_msg = ut.verify('config_data', data_config_map)
-    if len(err_msg) > 0:
-        return err_msg
+        err_msg = ut.verify('config_data', conf_maps['config_data'])
+        if len(err_msg) > 0:
+            return err_msg
 
     auto_data = 'auto_data' in main_conf_map and main_conf_map['auto_data']
 
@@ -89,7 +89,7 @@ def format_data(experiment_dir, **kwargs):
     # TODO:
     # make the parameters like threshold a list for the separate scans scenario
     if auto_data:
-        ut.write_config(data_conf_map, ut.join(experiment_dir,'conf', 'config_data'))
+        com.write_config(data_conf_map, ut.join(experiment_dir,'conf', 'config_data'))
 
 
 def main():